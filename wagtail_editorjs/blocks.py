@@ -1,6 +1,6 @@
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
-from wagtail.telepath import register
+from wagtail.admin.telepath import register
 from wagtail.blocks.field_block import (
     FieldBlock,
     FieldBlockAdapter,
@@ -0,0 +1,167 @@
+"""
+    Bulk rendering of `EditorJSField` values in a pool of processes.
+    Rendering is CPU bound; for static exports or warming the render cache
+    the documents are read in chunks and fanned out to worker processes.
+    The rendered HTML is returned to the calling process; which is the only writer.
+"""
+
+from typing import Any, Iterator, Union
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    wait,
+)
+from django.apps import apps
+from django.db import connections
+from django.db.models import QuerySet
+
+from . import settings
+from .render import render_editorjs_many
+
+import django
+import os
+
+
+def iter_chunks(queryset: QuerySet, field_name: str, chunk_size: int) -> Iterator[list[tuple[Any, dict]]]:
+    """
+        Reads `(pk, value)` pairs from the queryset in chunks, ordered by primary key.
+        Chunks are fetched by primary key ranges; not by offset.
+    """
+    queryset = queryset.order_by("pk")
+    last_pk = None
+    while True:
+        chunk = queryset
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+
+        rows = list(chunk.values_list("pk", field_name)[:chunk_size])
+        if not rows:
+            return
+
+        yield [
+            (pk, _to_plain(value))
+            for pk, value in rows
+        ]
+
+        last_pk = rows[-1][0]
+
+
+def _to_plain(value: Union[dict, None]) -> Union[dict, None]:
+    # Values are sent to other processes; strip the feature objects.
+    if not value:
+        return None
+
+    value = dict(value)
+    value["blocks"] = [
+        dict(block)
+        for block in value.get("blocks", [])
+    ]
+    return value
+
+
+def render_chunk(features: list[str], rows: list[tuple[Any, dict]], options: dict[str, Any]) -> list[tuple[Any, str]]:
+    """
+        Renders a chunk of `(pk, value)` pairs.
+        Empty values are rendered as an empty string.
+    """
+    indices = [
+        i for i, (_, value) in enumerate(rows)
+        if value
+    ]
+    rendered = render_editorjs_many(
+        [rows[i][1] for i in indices],
+        features,
+        **options,
+    )
+
+    html = [""] * len(rows)
+    for i, value in zip(indices, rendered):
+        html[i] = str(value)
+
+    return [
+        (pk, value)
+        for (pk, _), value in zip(rows, html)
+    ]
+
+
+def _init_worker():
+    # Workers which are not forked must set up Django themselves.
+    if not apps.ready:
+        django.setup()
+
+
+def _ready():
+    return True
+
+
+def bulk_render(
+        queryset: QuerySet,
+        field_name: str,
+        context: dict = None,
+        clean: bool = None,
+        cache: bool = None,
+        block_cache: bool = None,
+        workers: int = None,
+        chunk_size: int = None,
+        max_pending: int = None,
+    ) -> Iterator[tuple[Any, str]]:
+    """
+        Renders an `EditorJSField` for every object in the queryset.
+        Yields `(pk, html)` pairs as chunks are finished; not in the order of the queryset.
+
+        `workers` is the amount of processes (`EDITORJS_BULK_RENDER_WORKERS`); 0 renders in this process.
+        `chunk_size` is the amount of documents read and rendered at once (`EDITORJS_BULK_RENDER_CHUNK_SIZE`).
+        `max_pending` limits the amount of chunks in flight; defaults to twice the amount of workers.
+        The context is sent to the workers and must be picklable.
+        Workers use their own database connections; they cannot be started inside a transaction (`atomic()`).
+    """
+    if workers is None:
+        workers = settings.BULK_RENDER_WORKERS
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = settings.BULK_RENDER_CHUNK_SIZE
+    if max_pending is None:
+        max_pending = max(1, workers * 2)
+
+    features = queryset.model._meta.get_field(field_name).features
+    options = {
+        "context": context,
+        "clean": clean,
+        "cache": cache,
+        "block_cache": block_cache,
+    }
+
+    if workers == 0:
+        for rows in iter_chunks(queryset, field_name, chunk_size):
+            yield from render_chunk(features, rows, options)
+        return
+
+    # Forked workers must not share the database connections of this process;
+    # closing a connection in a transaction would throw away the transaction.
+    for connection in connections.all(initialized_only=True):
+        if connection.in_atomic_block:
+            raise ValueError(
+                f"bulk_render() cannot start workers inside a transaction on database {connection.alias!r}; "
+                "pass workers=0 to render in this process."
+            )
+
+    connections.close_all()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        # Start the workers before the database is used again.
+        executor.submit(_ready).result()
+
+        pending = set()
+        for rows in iter_chunks(queryset, field_name, chunk_size):
+            while len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+            pending.add(executor.submit(render_chunk, features, rows, options))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
@@ -0,0 +1,173 @@
+"""
+    Caching of rendered EditorJS documents and blocks.
+    Rendered HTML is stored in one of the Django caches, keyed by
+    the content of the document (or block) and everything else which influences the output.
+"""
+
+from typing import Any, Union
+from django.core.cache import caches, BaseCache
+from django.utils import translation
+
+from . import settings
+from .registry import EDITOR_JS_FEATURES
+
+import hashlib
+import json
+
+
+CACHE_KEY_PREFIX = "wagtail_editorjs"
+
+
+def get_render_cache(cache: bool = None) -> Union[BaseCache, None]:
+    """
+        Returns the cache to store rendered documents in.
+        Returns None if rendering should not be cached.
+    """
+    if cache is False:
+        return None
+
+    if cache is None and not settings.RENDER_CACHE:
+        return None
+
+    return caches[settings.RENDER_CACHE or "default"]
+
+
+def get_block_cache(block_cache: bool = None) -> Union[BaseCache, None]:
+    """
+        Returns the cache to store rendered blocks in.
+        Returns None if blocks should not be cached.
+    """
+    if block_cache is False:
+        return None
+
+    if block_cache is None and not settings.BLOCK_CACHE:
+        return None
+
+    return caches[settings.BLOCK_CACHE or "default"]
+
+
+def hash_data(data: Any) -> str:
+    """
+        Returns a stable hash of JSON serializable (block) data.
+    """
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"),
+    ).hexdigest()
+
+
+def get_request_url_root(context = None) -> str:
+    """
+        Returns the scheme and host of the request in the context (if any).
+        URLs in the output might be made absolute (or be site-relative) based on this.
+    """
+    if not context or "request" not in context:
+        return ""
+
+    request = context.get("request")
+    if request is None:
+        return ""
+
+    return request.build_absolute_uri("/")
+
+
+def get_cache_key(
+        features: list[str],
+        data: dict,
+        context = None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+    ) -> str:
+    """
+        Returns the cache key for a rendered document.
+    """
+    return ":".join([
+        CACHE_KEY_PREFIX,
+        "html",
+        hash_data(data.get("blocks", [])),
+        get_options_hash(features, context, clean, whitelist_tags, whitelist_attrs),
+    ])
+
+
+def get_options_hash(
+        features: list[str],
+        context = None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+    ) -> str:
+    """
+        Returns a hash of everything besides the blocks which influences a rendered document.
+    """
+    # Imported here; the render module depends on this one.
+    from .render import is_wrapper_overridden
+
+    if clean is None:
+        clean = settings.CLEAN_HTML
+
+    if isinstance(whitelist_attrs, dict):
+        whitelist_attrs = {
+            key: sorted(value)
+            for key, value in whitelist_attrs.items()
+        }
+    elif whitelist_attrs:
+        whitelist_attrs = sorted(whitelist_attrs)
+
+    url_root = get_request_url_root(context)
+    options = [
+        EDITOR_JS_FEATURES.fingerprint(features),
+        list(features),
+        translation.get_language(),
+        settings.USE_FULL_URLS and bool(url_root),
+        url_root,
+        bool(clean),
+        sorted(whitelist_tags or []),
+        whitelist_attrs,
+        settings.ADD_BLOCK_ID and settings.BLOCK_ID_ATTR,
+        context.get("block_id") if context else None,
+        bool(clean) and str(settings.SANITIZER),
+        settings.HTML_PARSER,
+        is_wrapper_overridden(),
+    ]
+
+    return hash_data(options)
+
+
+def get_content_hash(features: list[str], data: dict) -> str:
+    """
+        Returns a hash of the document and everything else which influences it's rendered HTML;
+        rendered without a request.
+    """
+    return hashlib.sha256(
+        get_cache_key(features, data).encode("utf-8"),
+    ).hexdigest()
+
+
+def get_block_cache_key(features: dict[str, Any], block: dict, context = None) -> str:
+    """
+        Returns the cache key for a rendered block.
+        The block is rendered with it's tunes applied; but before inlines are parsed and the HTML is cleaned.
+    """
+    tools = [block["type"]] + [
+        tune for tune in block.get("tunes", {})
+        if tune in features
+    ]
+
+    # Features may build URLs for the request's site (e.g. `page.get_url(request)`);
+    # the host matters even if full URLs are not used.
+    url_root = get_request_url_root(context)
+    options = [
+        EDITOR_JS_FEATURES.fingerprint(tools),
+        translation.get_language(),
+        settings.USE_FULL_URLS and bool(url_root),
+        url_root,
+        settings.ADD_BLOCK_ID and settings.BLOCK_ID_ATTR,
+        settings.HTML_PARSER,
+    ]
+
+    return ":".join([
+        CACHE_KEY_PREFIX,
+        "block",
+        hash_data(block),
+        hash_data(options),
+    ])
@@ -12,8 +12,7 @@ from ..registry import (
     EditorJSFeature,
     EditorJSBlock,
     EditorJSElement,
-    EditorJSSoupElement,
-    wrap_tag,
+    EditorJSRawElement,
 )
 
 
@@ -262,7 +261,7 @@ class BlockQuoteFeature(EditorJSFeature):
             "blockquote",
             [
                 text,
-                wrap_tag("footer", {}, caption),
+                EditorJSElement("footer", caption),
             ],
             {
                 "class": "blockquote",
@@ -437,7 +436,9 @@ class WagtailBlockFeature(EditorJSFeature):
     
     def render_block_data(self, block: EditorJSBlock, context=None) -> EditorJSElement:
         value: blocks.StructValue = self.block.to_python(block["data"]["block"])
-        return EditorJSSoupElement(f"<div class=\"{self.tool_name}\">{ self.block.render(value) }</div>")
+        return EditorJSRawElement("div", self.block.render(value), attrs={
+            "class": self.tool_name,
+        })
     
     @classmethod
     def get_test_data(cls):
@@ -502,11 +503,29 @@ class ButtonFeature(PageChooserURLsMixin, EditorJSFeature):
         ] = f"editorjs-{self.model._meta.model_name}-button-chooser-{context['widget']['attrs']['id']}"
         return config
     
+    def prefetch(self, blocks: list[EditorJSBlock], context = None) -> dict[str, Page]:
+        return self.prefetch_model(self.model, [
+            block["data"]["pageId"]
+            for block in blocks
+        ])
+
+    async def aprefetch(self, blocks: list[EditorJSBlock], context = None) -> dict[str, Page]:
+        return await self.aprefetch_model(self.model, [
+            block["data"]["pageId"]
+            for block in blocks
+        ])
+
     def render_block_data(self, block: EditorJSBlock, context=None) -> EditorJSElement:
-        try:
-            page = self.model.objects.get(id=block["data"]["pageId"])
-        except self.model.DoesNotExist:
-            return None
+        pages = self.get_prefetched()
+        if pages is not None:
+            page = pages.get(str(block["data"]["pageId"]))
+            if page is None:
+                return None
+        else:
+            try:
+                page = self.model.objects.get(id=block["data"]["pageId"])
+            except self.model.DoesNotExist:
+                return None
 
         request = None
         if context:
@@ -82,10 +82,25 @@ class AttachesFeature(FeatureViewMixin, EditorJSFeature):
             raise forms.ValidationError("Invalid title value")
         
 
+    def prefetch(self, blocks: list[EditorJSBlock], context = None) -> dict[str, "AbstractDocument"]:
+        return self.prefetch_model(Document, [
+            block["data"]["file"]["id"]
+            for block in blocks
+        ])
+
+    async def aprefetch(self, blocks: list[EditorJSBlock], context = None) -> dict[str, "AbstractDocument"]:
+        return await self.aprefetch_model(Document, [
+            block["data"]["file"]["id"]
+            for block in blocks
+        ])
+
     def render_block_data(self, block: EditorJSBlock, context = None) -> EditorJSElement:
 
         document_id = block["data"]["file"]["id"]
-        document = Document.objects.get(pk=document_id)
+        documents = self.get_prefetched()
+        document = documents.get(str(document_id)) if documents is not None else None
+        if document is None:
+            document = Document.objects.get(pk=document_id)
         url = document.url
 
         if not any([url.startswith(i) for i in ["http://", "https://", "//"]])\
@@ -110,9 +110,24 @@ class ImageFeature(BaseImageFeature):
             {"id": widget_id}
         )
     
+    def prefetch(self, blocks: list[EditorJSBlock], context = None) -> dict[str, "AbstractImage"]:
+        return self.prefetch_model(Image, [
+            block["data"].get("imageId")
+            for block in blocks
+        ])
+
+    async def aprefetch(self, blocks: list[EditorJSBlock], context = None) -> dict[str, "AbstractImage"]:
+        return await self.aprefetch_model(Image, [
+            block["data"].get("imageId")
+            for block in blocks
+        ])
+
     def render_block_data(self, block: EditorJSBlock, context = None) -> EditorJSElement:
-        image = block["data"].get("imageId")
-        image = Image.objects.get(id=image)
+        image_id = block["data"].get("imageId")
+        images = self.get_prefetched()
+        image = images.get(str(image_id)) if images is not None else None
+        if image is None:
+            image = Image.objects.get(id=image_id)
 
         classlist = []
         styles = {}
@@ -249,19 +264,32 @@ class ImageRowFeature(BaseImageFeature):
             if "title" not in image:
                 raise forms.ValidationError("Invalid title value")
     
+    def prefetch(self, blocks: list[EditorJSBlock], context = None) -> dict[str, "AbstractImage"]:
+        return self.prefetch_model(Image, [
+            image["id"]
+            for block in blocks
+            for image in block["data"]["images"]
+        ])
+
+    async def aprefetch(self, blocks: list[EditorJSBlock], context = None) -> dict[str, "AbstractImage"]:
+        return await self.aprefetch_model(Image, [
+            image["id"]
+            for block in blocks
+            for image in block["data"]["images"]
+        ])
+
     def render_block_data(self, block: EditorJSBlock, context = None) -> EditorJSElement:
         images = block["data"]["images"]
         ids = []
         for image in images:
-            ids.append(image["id"])
+            ids.append(str(image["id"]))
+
+        images = self.get_prefetched()
+        if images is None or any(id not in images for id in ids):
+            images = self.prefetch_model(Image, ids)
 
-        images = Image.objects.in_bulk(ids)
         s = []
         for id in ids:
-            try:
-                id = int(id)
-            except ValueError:
-                pass
             image = images[id]
             url = image.file.url
             if not any([url.startswith(i) for i in ["http://", "https://", "//"]])\
@@ -5,31 +5,25 @@ from ..registry import (
     EditorJSFeature,
     EditorJSBlock,
     EditorJSElement,
-    wrap_tag,
 )
 
 
 class NestedListElement(EditorJSElement):
+    __slots__ = ()
+    # The items are written one after another; this keeps the markup of the list items intact.
+    separator = ""
+
     def __init__(self, tag: str, items: list[EditorJSElement], close_tag: bool = True, attrs: dict[str, Any] = None):
-        super().__init__(tag=tag, content=None, close_tag=close_tag, attrs=attrs)
-        self.items = items
+        super().__init__(tag=tag, content=items, close_tag=close_tag, attrs=attrs)
 
-    def __str__(self):
-        return wrap_tag(self.tag, self.attrs, "".join([str(item) for item in self.items]), self.close_tag)
-    
     @property
-    def content(self):
-        return "".join([str(item) for item in self.items])
-    
-    @content.setter
-    def content(self, value):
-        if isinstance(value, list):
-            self.items = value
-        else:
-            self.items = [value]
+    def items(self) -> list[EditorJSElement]:
+        # Stored as the element's content; the tree can be serialized like any other.
+        return self._content
 
-    def append(self, item: "NestedListElement"):
-        self.items.append(item)
+    @items.setter
+    def items(self, value: list[EditorJSElement]):
+        self._content = value
 
 
 def parse_list(items: list[dict[str, Any]], element: str, depth = 0) -> NestedListElement:
@@ -130,15 +124,15 @@ class CheckListFeature(EditorJSFeature):
                 raise forms.ValidationError("Invalid text value")
     
     def render_block_data(self, block: EditorJSBlock, context = None) -> EditorJSElement:
-        s = []
+        items = []
         for item in block["data"]["items"]:
-            class_ = "checklist-item"
+            class_ = ["checklist-item"]
             if item["checked"]:
-                class_ += " checked"
+                class_.append("checked")
 
-            s.append(wrap_tag("li", {"class": class_}, item["text"]))
+            items.append(EditorJSElement("li", item["text"], attrs={"class": class_}))
 
-        return EditorJSElement("ul", "".join(s), attrs={"class": "checklist"})
+        return NestedListElement("ul", items, attrs={"class": "checklist"})
     
     @classmethod
     def get_test_data(cls):
@@ -1,22 +1,131 @@
 from typing import Any
+from functools import cache, partialmethod
+from django.core import checks
 from django.db import models
+from django.db.models import signals
+from django.dispatch import receiver
 from django.utils.functional import cached_property
-from django.core.exceptions import ValidationError
+from django.utils.safestring import mark_safe
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 
+from . import settings
+from .cache import get_content_hash, get_request_url_root
 from .forms import EditorJSFormField
 from .registry import EDITOR_JS_FEATURES, get_features
+from .render import render_editorjs_html
+
+
+RENDERED_HASH_PREFIX = "<!--editorjs:"
+RENDERED_HASH_SUFFIX = "-->"
+
+
+def split_rendered_html(value: str) -> tuple[str, str]:
+    """
+        Splits the value of a rendered field into the content hash and the HTML.
+        The hash is empty if the value was not written by `EditorJSField`.
+    """
+    if not value or not value.startswith(RENDERED_HASH_PREFIX):
+        return "", value or ""
+
+    end = value.find(RENDERED_HASH_SUFFIX, len(RENDERED_HASH_PREFIX))
+    if end == -1:
+        return "", value
+
+    return (
+        value[len(RENDERED_HASH_PREFIX):end],
+        value[end + len(RENDERED_HASH_SUFFIX):],
+    )
+
+
+def _get_rendered_html(obj: models.Model, context = None, *, field: "EditorJSField"):
+    return field.get_rendered_html(obj, context)
+
+
+@cache
+def _get_rendered_fields(model: type[models.Model]) -> list["EditorJSField"]:
+    return [
+        field for field in model._meta.concrete_fields
+        if isinstance(field, EditorJSField) and field.rendered_field
+    ]
+
+
+@receiver(signals.pre_save)
+def _update_rendered_fields(sender, instance: models.Model, update_fields = None, raw: bool = False, **kwargs):
+    """
+        Renders the HTML before any field is saved; Django reads the fields in the order they were declared,
+        the rendered field might come before the `EditorJSField`.
+        If `update_fields` leaves out the rendered field it is updated separately.
+        Raw saves (`loaddata`) are stored as is; related objects might not have been loaded yet.
+    """
+    if raw:
+        return
+
+    for field in _get_rendered_fields(sender):
+        if update_fields is not None and field.name not in update_fields and field.attname not in update_fields:
+            continue
+
+        changed = field.update_rendered_html(instance, getattr(instance, field.attname))
+        if changed and update_fields is not None and field.rendered_field not in update_fields:
+            sender._base_manager.filter(pk=instance.pk).update(**{
+                field.rendered_field: getattr(instance, field.rendered_field),
+            })
 
 
 class EditorJSField(models.JSONField):
     def __init__(self,
             features: list[str] = None,
             tools_config: dict  = None,
+            rendered_field: str = None,
             *args, **kwargs
         ):
+        """
+            `rendered_field` is the name of a text field on the model which stores the rendered HTML.
+            It is updated when the model is saved; `get_<name>_html()` reads it,
+            or renders the value if the stored HTML is stale.
+        """
         self._features = features
         self.tools_config = tools_config or {}
+        self.rendered_field = rendered_field
         super().__init__(*args, **kwargs)
 
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        method_name = f"get_{self.name}_html"
+        if method_name not in cls.__dict__:
+            setattr(cls, method_name, partialmethod(_get_rendered_html, field=self))
+
+    def check(self, **kwargs):
+        return [
+            *super().check(**kwargs),
+            *self._check_rendered_field(),
+        ]
+
+    def _check_rendered_field(self):
+        if not self.rendered_field:
+            return []
+
+        try:
+            field = self.model._meta.get_field(self.rendered_field)
+        except FieldDoesNotExist:
+            return [
+                checks.Error(
+                    f"'rendered_field' refers to the nonexistent field '{self.rendered_field}'.",
+                    obj=self,
+                    id="wagtail_editorjs.E001",
+                )
+            ]
+
+        if not isinstance(field, models.TextField):
+            return [
+                checks.Error(
+                    f"'rendered_field' must refer to a TextField; '{self.rendered_field}' is a {field.__class__.__name__}.",
+                    obj=self,
+                    id="wagtail_editorjs.E002",
+                )
+            ]
+
+        return []
+
     @cached_property
     def features(self):
         return get_features(self._features)
@@ -25,12 +134,67 @@ class EditorJSField(models.JSONField):
         name, path, args, kwargs = super().deconstruct()
         kwargs['features'] = self.features
         kwargs['tools_config'] = self.tools_config
+        if self.rendered_field:
+            kwargs['rendered_field'] = self.rendered_field
         return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        value = super().pre_save(model_instance, add)
+        if self.rendered_field:
+            # Saves send `pre_save` first; this covers `bulk_create`, which does not.
+            self.update_rendered_html(model_instance, value)
+        return value
+
+    def update_rendered_html(self, model_instance: models.Model, value: Any = None) -> bool:
+        """
+            Renders the value into the rendered field of the instance.
+            Nothing is rendered if the stored HTML is for the same content.
+            Returns whether the rendered field changed.
+        """
+        stored = getattr(model_instance, self.rendered_field)
+        if value is None:
+            setattr(model_instance, self.rendered_field, "")
+            return bool(stored)
+
+        content_hash = get_content_hash(self.features, value)
+        stored_hash, _ = split_rendered_html(stored)
+        if stored_hash == content_hash:
+            return False
+
+        html = render_editorjs_html(self.features, value)
+        setattr(model_instance, self.rendered_field, "".join([
+            RENDERED_HASH_PREFIX, content_hash, RENDERED_HASH_SUFFIX, html,
+        ]))
+        return True
+
+    def get_rendered_html(self, model_instance: models.Model, context = None) -> str:
+        """
+            Returns the HTML stored in the rendered field if it is up to date;
+            otherwise the value is rendered.
+            The stored HTML is rendered without a request; when full URLs should be used
+            for the request in the context the value is rendered as well.
+        """
+        value = getattr(model_instance, self.attname)
+        if value is None:
+            return mark_safe("")
+
+        use_stored = not (settings.USE_FULL_URLS and get_request_url_root(context))
+        if self.rendered_field and use_stored:
+            stored_hash, html = split_rendered_html(
+                getattr(model_instance, self.rendered_field),
+            )
+            if stored_hash and stored_hash == get_content_hash(self.features, value):
+                return mark_safe(html)
+
+        return render_editorjs_html(self.features, value, context=context)
     
     def from_db_value(self, value: Any, expression, connection) -> Any:
         value = super().from_db_value(
             value, expression, connection
         )
+        if value is None:
+            return value
+
         return EDITOR_JS_FEATURES.to_python(
             self.features, value
         )
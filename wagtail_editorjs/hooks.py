@@ -10,3 +10,9 @@ Any additional configuration or overrides can be done here.
 """
 BUILD_CONFIG_HOOK = "editorjs_widget_build_config"
 
+"""
+Hook called after every render with the instrumentation records of that render.
+Receives a list of `wagtail_editorjs.instrumentation.RenderRecord` and the rendering context.
+Registering this hook enables instrumentation; which adds some overhead.
+"""
+RENDER_STATS_HOOK = "editorjs_render_stats"
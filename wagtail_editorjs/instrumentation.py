@@ -0,0 +1,166 @@
+"""
+    Instrumentation of the render pipeline.
+    Records the wall time, database queries and output size of every
+    feature, tune and inline; as well as the prefetch, sanitize and wrapper stages.
+    Converting (`to_python`) and validating blocks is recorded per feature as well.
+
+    Records are only made while a `RenderCollector` is active,
+    or if any functions are registered for the `RENDER_STATS_HOOK`.
+"""
+
+from typing import Union
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from django.db import connection
+from wagtail import hooks
+
+from .hooks import RENDER_STATS_HOOK
+
+import time
+
+
+_collectors: ContextVar[tuple["RenderCollector"]] = ContextVar(
+    "wagtail_editorjs_collectors", default=(),
+)
+
+
+class RenderRecord:
+    """
+        A single measurement of a stage in the render pipeline.
+        `kind` is one of `prefetch`, `feature`, `tune`, `inline`, `sanitize`, `wrapper`, `to_python` or `validate`.
+        `queries` and `size` are None if they could not be measured.
+    """
+
+    def __init__(self, kind: str, name: str, duration: float = 0.0, queries: int = None, size: int = None, count: int = 1):
+        self.kind = kind
+        self.name = name
+        self.duration = duration
+        self.queries = queries
+        self.size = size
+        self.count = count
+
+    def __repr__(self):
+        return f"<RenderRecord {self.kind}:{self.name} duration={self.duration:.6f} queries={self.queries} size={self.size} count={self.count}>"
+
+    def merge(self, other: "RenderRecord"):
+        self.duration += other.duration
+        self.count += other.count
+        if other.queries is not None:
+            self.queries = (self.queries or 0) + other.queries
+        if other.size is not None:
+            self.size = (self.size or 0) + other.size
+
+
+class RenderCollector:
+    """
+        Collects the records of all renders while it is active.
+
+        with RenderCollector() as collector:
+            render_editorjs_html(features, data)
+
+        collector.summary()[("feature", "image")].queries
+    """
+
+    def __init__(self):
+        self.records: list[RenderRecord] = []
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_collectors.set(_collectors.get() + (self,)))
+        return self
+
+    def __exit__(self, *args):
+        _collectors.reset(self._tokens.pop())
+
+    def add(self, record: RenderRecord):
+        self.records.append(record)
+
+    def clear(self):
+        self.records.clear()
+
+    def summary(self) -> dict[tuple[str, str], RenderRecord]:
+        """
+            Returns the records combined by `(kind, name)`.
+        """
+        summary = {}
+        for record in self.records:
+            key = (record.kind, record.name)
+            if key not in summary:
+                summary[key] = RenderRecord(record.kind, record.name, count=0)
+            summary[key].merge(record)
+        return summary
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def is_recording() -> bool:
+    """
+        Returns True if any collector is active.
+    """
+    return bool(_collectors.get())
+
+
+class _Recorder:
+    def __init__(self, collectors: tuple[RenderCollector], kind: str, name: str, count_queries: bool = True):
+        self.collectors = collectors
+        self.record = RenderRecord(kind, name)
+        self.counter = _QueryCounter() if count_queries else None
+        self.wrapper = None
+        self.start = None
+
+    def __enter__(self) -> RenderRecord:
+        if self.counter is not None:
+            self.wrapper = connection.execute_wrapper(self.counter)
+            self.wrapper.__enter__()
+        self.start = time.perf_counter()
+        return self.record
+
+    def __exit__(self, *args):
+        self.record.duration = time.perf_counter() - self.start
+        if self.wrapper is not None:
+            self.wrapper.__exit__(*args)
+            self.record.queries = self.counter.count
+
+        for collector in self.collectors:
+            collector.add(self.record)
+
+
+_NOT_RECORDING = nullcontext(None)
+
+
+def record(kind: str, name: str, count_queries: bool = True) -> Union[_Recorder, nullcontext]:
+    """
+        Context manager which measures the code inside the block.
+        Returns the `RenderRecord` on enter so the caller can set it's `size`;
+        or None if nothing is being recorded.
+    """
+    collectors = _collectors.get()
+    if not collectors:
+        return _NOT_RECORDING
+
+    return _Recorder(collectors, kind, name, count_queries)
+
+
+@contextmanager
+def instrument_render(context = None):
+    """
+        Collects the records of a single render for the `RENDER_STATS_HOOK`.
+        Every registered hook is called with the records and the render context afterwards.
+    """
+    render_hooks = hooks.get_hooks(RENDER_STATS_HOOK)
+    if not render_hooks:
+        yield None
+        return
+
+    with RenderCollector() as collector:
+        yield collector
+
+    for hook in render_hooks:
+        hook(collector.records, context)
@@ -0,0 +1,210 @@
+from typing import Any, Iterator
+from itertools import islice
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+from django.test import RequestFactory
+from urllib.parse import urlsplit
+from wagtail import blocks
+from wagtail.fields import StreamField
+
+from ... import settings
+from ...blocks import EditorJSBlock
+from ...fields import EditorJSField
+from ...render import render_editorjs_many
+
+import json
+import os
+import time
+
+
+def has_editorjs_block(block: blocks.Block) -> bool:
+    """
+        Returns True if the block is (or contains) an `EditorJSBlock`.
+    """
+    if isinstance(block, EditorJSBlock):
+        return True
+
+    if isinstance(block, blocks.ListBlock):
+        return has_editorjs_block(block.child_block)
+
+    return any(
+        has_editorjs_block(child_block)
+        for child_block in getattr(block, "child_blocks", {}).values()
+    )
+
+
+def iter_block_values(block: blocks.Block, value: Any) -> Iterator[tuple[list[str], dict]]:
+    """
+        Yields `(features, value)` for every `EditorJSBlock` value inside a block value.
+    """
+    if not value:
+        return
+
+    if isinstance(block, EditorJSBlock):
+        yield block.features, value
+
+    elif isinstance(block, blocks.StreamBlock):
+        for child in value:
+            yield from iter_block_values(child.block, child.value)
+
+    elif isinstance(block, blocks.ListBlock):
+        for item in value:
+            yield from iter_block_values(block.child_block, item)
+
+    elif isinstance(block, blocks.StructBlock):
+        for name, child_block in block.child_blocks.items():
+            yield from iter_block_values(child_block, value.get(name))
+
+
+def get_editorjs_fields(labels: list[str] = None) -> list[tuple[type[models.Model], models.Field]]:
+    """
+        Returns every `EditorJSField` and every `StreamField` containing an `EditorJSBlock`.
+        Inherited fields are only returned for the model which defines them.
+    """
+    if labels:
+        try:
+            model_list = [apps.get_model(label) for label in labels]
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+    else:
+        model_list = apps.get_models()
+
+    fields = []
+    for model in model_list:
+        if model._meta.proxy:
+            continue
+
+        for field in model._meta.local_concrete_fields:
+            if isinstance(field, EditorJSField):
+                fields.append((model, field))
+            elif isinstance(field, StreamField) and has_editorjs_block(field.stream_block):
+                fields.append((model, field))
+
+    return fields
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders every EditorJS value in the database and stores the HTML in the render cache, "
+        "so the first visitor after a deploy does not pay the render cost. "
+        "Requires EDITORJS_RENDER_CACHE to be set; otherwise renders never read the cache. "
+        "Without --url the HTML is cached for renders without a request in the context; "
+        "renders with a request look up other keys and are only warmed by passing the site's URL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models", nargs="*", metavar="app_label.ModelName",
+            help="Only warm these models; defaults to every model with EditorJS content.",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=100,
+            help="The amount of rows fetched and rendered at once.",
+        )
+        parser.add_argument(
+            "--url", action="append", dest="urls", default=[],
+            help=(
+                "The root URL of the site the content is rendered for, i.e. https://example.com. "
+                "Rendered HTML is cached per host; can be passed multiple times. "
+                "If not passed, only renders without a request in the context are warmed."
+            ),
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="A file to store progress in; an interrupted run continues where it stopped.",
+        )
+        parser.add_argument(
+            "--reset", action="store_true",
+            help="Ignore (and overwrite) the progress stored in the checkpoint file.",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.RENDER_CACHE:
+            # `cache=True` would fall back to the default cache, which normal renders never read.
+            raise CommandError(
+                "EDITORJS_RENDER_CACHE is not set; rendered HTML is not cached, so there is nothing to warm."
+            )
+
+        chunk_size = options["chunk_size"]
+        checkpoint_path = options["checkpoint"]
+        contexts = [
+            self.get_context(url)
+            for url in options["urls"]
+        ] or [None]
+
+        checkpoint = {}
+        if checkpoint_path and not options["reset"] and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as f:
+                checkpoint = json.load(f)
+
+        total_start = time.perf_counter()
+        total = 0
+        for model, field in get_editorjs_fields(options["models"]):
+            key = f"{model._meta.label}.{field.name}"
+            start = time.perf_counter()
+            count = 0
+
+            queryset = model._default_manager.order_by("pk")
+            if key in checkpoint:
+                queryset = queryset.filter(pk__gt=checkpoint[key])
+
+            rows = queryset.values_list("pk", field.name).iterator(chunk_size=chunk_size)
+            while chunk := list(islice(rows, chunk_size)):
+                values = self.get_values(field, chunk)
+                for context in contexts:
+                    for features, data in values.items():
+                        render_editorjs_many(data, list(features), context=context, cache=True)
+
+                count += len(chunk)
+                if checkpoint_path:
+                    checkpoint[key] = chunk[-1][0]
+                    self.write_checkpoint(checkpoint_path, checkpoint)
+
+                if options["verbosity"] >= 2:
+                    self.stdout.write(f"{key}: {count} rows ({time.perf_counter() - start:.2f}s)")
+
+            total += count
+            self.stdout.write(f"{key}: warmed {count} rows in {time.perf_counter() - start:.2f}s")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed {total} rows in {time.perf_counter() - total_start:.2f}s",
+        ))
+
+    def get_context(self, url: str) -> dict:
+        # The cache key depends on the host of the request; see `get_request_url_root`.
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise CommandError(f"Invalid URL: {url}")
+
+        request = RequestFactory().get(
+            "/", HTTP_HOST=parts.netloc, secure=parts.scheme == "https",
+        )
+        return {"request": request}
+
+    def get_values(self, field: models.Field, rows: list[tuple[Any, Any]]) -> dict[tuple[str], list[dict]]:
+        """
+            Groups the EditorJS values in the rows by their features;
+            values with the same features are rendered together.
+        """
+        values = {}
+        for _, value in rows:
+            if not value:
+                continue
+
+            if isinstance(field, StreamField):
+                found = iter_block_values(field.stream_block, value)
+            else:
+                found = [(field.features, value)]
+
+            for features, data in found:
+                values.setdefault(tuple(features), []).append(data)
+
+        return values
+
+    def write_checkpoint(self, path: str, checkpoint: dict):
+        # Write to a temporary file first; an interrupted write must not corrupt the checkpoint.
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(checkpoint, f, default=str)
+        os.replace(tmp, path)
@@ -9,8 +9,11 @@ from .features import (
     EditorJSTune,
     FeatureViewMixin,
     InlineEditorJSFeature,
+    InlineDispatcher,
     ModelInlineEditorJSFeature,
     TemplateNotSpecifiedError,
+    prefetch_blocks,
+    aprefetch_blocks,
 )
 from .value import (
     EditorJSBlock,
@@ -18,13 +21,18 @@ from .value import (
 )
 from .element import (
     EditorJSElement,
+    EditorJSRawElement,
     EditorJSSoupElement,
     EditorJSWrapper,
     wrapper,
     EditorJSElementAttribute,
     EditorJSStyleAttribute,
     wrap_tag,
+    make_attrs,
     add_attributes,
+    parse_html,
+    dump_element,
+    load_element,
 )
 
 def get_features(features: list[str] = None):
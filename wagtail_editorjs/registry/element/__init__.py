@@ -4,11 +4,18 @@ from .attrs import (
 )
 from .utils import (
     wrap_tag,
+    make_attrs,
     add_attributes,
+    parse_html,
 )
 from .element import (
     EditorJSElement,
+    EditorJSRawElement,
     EditorJSSoupElement,
     EditorJSWrapper,
     wrapper,
-)
\ No newline at end of file
+)
+from .serialize import (
+    dump_element,
+    load_element,
+)
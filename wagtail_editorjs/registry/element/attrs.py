@@ -1,41 +1,93 @@
-from typing import Any, Union
+from typing import Any, Iterable, Union
+
+
+class OrderedValues(dict):
+    """
+        A set of attribute values which keeps the order they were added in.
+        The values are the keys of the dict; iterating over it is the same in every process.
+    """
+    __slots__ = ()
+
+    def add(self, value: Any):
+        self[value] = None
+
+    def update(self, values: Iterable[Any]):
+        for value in values:
+            self[value] = None
+
+    def discard(self, value: Any):
+        self.pop(value, None)
 
 
 class EditorJSElementAttribute:
+    """
+        The value of a HTML attribute.
+        Multiple values are kept in the order they were added in, without duplicates;
+        sets are sorted first, so the output never depends on hash randomization.
+        A single value is stored as is; it is only promoted
+        to `OrderedValues` when the attribute is extended or it's `value` is accessed.
+    """
+    __slots__ = ("_value", "delimiter")
+
     def __init__(self, value: Union[str, list[str]], delimiter: str = " "):
-        if not isinstance(value, (list, dict)):
-            value = [value]
+        if isinstance(value, (set, frozenset)):
+            value = sorted(value, key=str)
 
-        if not isinstance(value, dict):
-            value = set(value)
+        if isinstance(value, (list, tuple)):
+            value = OrderedValues.fromkeys(value)
+            if len(value) == 1:
+                value, = value
 
-        self.value = value
+        self._value = value
         self.delimiter = delimiter
 
+    @property
+    def value(self) -> Union[OrderedValues, dict]:
+        if not isinstance(self._value, dict):
+            self._value = OrderedValues.fromkeys((self._value,))
+        return self._value
+
+    @value.setter
+    def value(self, value: Union[OrderedValues, dict]):
+        self._value = value
+
+    def _values(self) -> Union[dict, tuple]:
+        if isinstance(self._value, dict):
+            return self._value
+        return (self._value,)
+
     def __eq__(self, other):
         if isinstance(other, EditorJSElementAttribute):
-            return self.value == other.value
-        
+            return set(self._values()) == set(other._values())
+
         if isinstance(other, (tuple, list, set)):
+            values = self._values()
             for item in other:
-                if item not in self.value:
+                if item not in values:
                     return False
             return True
         return False
 
     def extend(self, value: Any):
 
-        if isinstance(value, (tuple, list, set)):
+        if isinstance(value, (set, frozenset)):
+            self.value.update(sorted(value, key=str))
+
+        elif isinstance(value, (tuple, list)):
             self.value.update(value)
 
         else:
             self.value.add(value)
 
     def __str__(self):
-        return self.delimiter.join([str(item) for item in self.value])
-    
+        if not isinstance(self._value, dict):
+            return str(self._value)
+        return self.delimiter.join([str(item) for item in self._value])
+
 
 class EditorJSStyleAttribute(EditorJSElementAttribute):
+    __slots__ = ()
+
     def __init__(self, value: dict):
         super().__init__(value, ";")
 
@@ -45,10 +97,10 @@ class EditorJSStyleAttribute(EditorJSElementAttribute):
     def __eq__(self, other):
         if isinstance(other, EditorJSStyleAttribute):
             return self.value == other.value
-        
+
         if isinstance(other, dict):
             return self.value == other
-        
+
         if isinstance(other, str):
             try:
                 key, value = other.split(":")
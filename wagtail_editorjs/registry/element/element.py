@@ -1,6 +1,6 @@
 from typing import Any, Union, TypeVar
 from .attrs import EditorJSElementAttribute
-from .utils import add_attributes, wrap_tag, _make_attr
+from .utils import add_attributes, wrap_tag, make_attrs, parse_html, _make_attr
 import bs4
 
 
@@ -11,7 +11,11 @@ class EditorJSElement:
     """
         Base class for all elements.
     """
-    
+    __slots__ = ("tag", "_content", "attrs", "close_tag")
+
+    # Written between the items of the content.
+    separator = "\n"
+
     def __init__(self, tag: str, content: Union[str, list[str]] = None, attrs: dict[str, EditorJSElementAttribute] = None, close_tag: bool = True):
         attrs = attrs or {}
         content = content or []
@@ -48,7 +52,12 @@ class EditorJSElement:
     @property
     def content(self):
         if isinstance(self._content, list):
-            return "\n".join([str(item) for item in self._content])
+            out = []
+            for i, item in enumerate(self._content):
+                if i:
+                    out.append(self.separator)
+                _write_item(item, out)
+            return "".join(out)
         return str(self._content)
     
     @content.setter
@@ -61,19 +70,105 @@ class EditorJSElement:
     def append(self, element: "EditorJSElement"):
         self._content.append(element)
 
+    def write(self, out: list[str]):
+        """
+            Write the HTML for this element (and all of it's children) into `out`.
+            This allows a whole tree of elements to render into one shared buffer.
+            The tree is walked once, without recursion; every piece of HTML is only written once.
+            Subclasses can override this to write themselves; or override `__str__` (or `content`)
+            to keep rendering the way they used to.
+        """
+        item_type = type(self)
+        if item_type.write is EditorJSElement.write and item_type.__str__ is not EditorJSElement.__str__:
+            # Subclasses with a custom `__str__` keep rendering through it.
+            # Subclasses which override `write()` only get here through `super()`; their `__str__`
+            # may well call `write()` again, so for them the tree is written directly.
+            out.append(str(self))
+            return
+
+        self._write_tree(out)
+
+    def _write_tree(self, out: list[str]):
+        """
+            Writes this element the default way; only it's children are dispatched to their own `write` or `__str__`.
+            This way a subclass can still call `super().__str__()` (or `super().write()`) from it's overrides.
+        """
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                out.append(item)
+                continue
+
+            if not isinstance(item, EditorJSElement):
+                out.append(str(item))
+                continue
+
+            item_type = type(item)
+            if item is not self and (item_type.write is not EditorJSElement.write or item_type.__str__ is not EditorJSElement.__str__):
+                item.write(out)
+                continue
+
+            if item_type.content is not EditorJSElement.content:
+                out.append(wrap_tag(
+                    item.tag,
+                    attrs = item.attrs,
+                    content = item.content,
+                    close_tag = item.close_tag
+                ))
+                continue
+
+            attributes = f" {make_attrs(item.attrs)}" if item.attrs else ""
+            out.append(f"<{item.tag}{attributes}>")
+
+            content = item._content
+            if not isinstance(content, list):
+                content = [content]
+
+            # Pushed in reverse; the closing tag is written last.
+            stack.append(f"</{item.tag}>")
+            separator = item.separator
+            for i in range(len(content) - 1, -1, -1):
+                stack.append(content[i])
+                if i and separator:
+                    stack.append(separator)
+
     def __str__(self):
-        return wrap_tag(
-            self.tag,
-            attrs = self.attrs,
-            content = self.content,
-            close_tag = self.close_tag
-        )
-    
+        out = []
+        if type(self).write is not EditorJSElement.write:
+            self.write(out)
+        else:
+            self._write_tree(out)
+        return "".join(out)
+
+
+def _write_item(item: Any, out: list[str]):
+    if isinstance(item, EditorJSElement):
+        item.write(out)
+    else:
+        out.append(str(item))
+
+
+class EditorJSRawElement(EditorJSElement):
+    """
+        An element around a fragment of HTML which is never parsed.
+        Only the outer tag and it's attributes are modelled; the fragment is written as is.
+        Use this instead of `EditorJSSoupElement` when only the outer tag needs to change.
+    """
+    __slots__ = ()
+
+    def __init__(self, tag: str, raw_html: str = "", attrs: dict[str, EditorJSElementAttribute] = None, close_tag: bool = True):
+        super().__init__(tag, [raw_html], attrs=attrs, close_tag=close_tag)
+
+    @property
+    def raw_html(self) -> str:
+        return "".join([str(item) for item in self._content])
+
 
 class EditorJSSoupElement(EditorJSElement):
     def __init__(self, raw_html: str):
         self.raw_html = raw_html
-        self.soup = bs4.BeautifulSoup(raw_html, "html.parser")
+        self.soup = parse_html(raw_html)
         self.soupContent = self.soup.contents[0]
 
     @property
@@ -82,7 +177,7 @@ class EditorJSSoupElement(EditorJSElement):
     
     @content.setter
     def content(self, value):
-        self.soup = bs4.BeautifulSoup(value, "html.parser")
+        self.soup = parse_html(value)
         self.soupContent = self.soup.contents[0]
 
     @property
@@ -124,6 +219,8 @@ def wrapper(element: EditorJSElement, attrs: dict[str, EditorJSElementAttribute]
 
 
 class EditorJSWrapper(EditorJSElement):
+    __slots__ = ()
+
     @property
     def is_wrapped(self):
         return True
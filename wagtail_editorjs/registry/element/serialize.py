@@ -0,0 +1,201 @@
+"""
+    A compact, versioned serialization of element trees.
+    Blocks can be stored after they were rendered, but before anything depending on the context
+    (tunes, inlines, cleaning) is applied; loading them is a lot faster than calling `render_block_data` again.
+
+    The tree is stored as a flat list of nodes packed with `marshal`; children are referenced by their index.
+    This keeps the payload small and lets trees of any depth be loaded without recursion.
+"""
+from typing import Any, Union
+from django.utils.module_loading import import_string
+
+from .attrs import EditorJSElementAttribute, OrderedValues
+from .element import EditorJSElement
+
+import functools
+import marshal
+
+
+SERIALIZATION_HEADER = b"EJS"
+
+# Bump this whenever the layout of the nodes (or of the elements themselves) changes.
+SERIALIZATION_VERSION = 1
+
+_PREFIX = SERIALIZATION_HEADER + bytes([SERIALIZATION_VERSION])
+
+_ELEMENT_SLOTS = frozenset(EditorJSElement.__slots__)
+
+_ATTRIBUTE_SLOTS = frozenset(EditorJSElementAttribute.__slots__)
+
+_PLAIN_TYPES = (int, float, bool, type(None))
+
+
+def dump_element(element: EditorJSElement) -> bytes:
+    """
+        Serializes an element and all of it's children to bytes.
+        Children which cannot be serialized (because they hold state besides their tag, attributes and content)
+        are stored as the HTML they render to. Raises a TypeError if this is the case for `element` itself.
+    """
+    classes: dict[type, int] = {}
+    if _get_class_index(element, classes) is None:
+        raise TypeError(f"Cannot serialize {type(element).__name__}; it holds state besides it's tag, attributes and content")
+
+    elements = [element]
+    nodes = []
+    i = 0
+    # Breadth first; a child is always stored after it's parent.
+    while i < len(elements):
+        item = elements[i]
+        i += 1
+
+        content = item._content
+        if not isinstance(content, list):
+            content = [content]
+
+        children = []
+        for child in content:
+            if isinstance(child, EditorJSElement) and _get_class_index(child, classes) is not None:
+                children.append(len(elements))
+                elements.append(child)
+            else:
+                children.append(str.__str__(str(child)))
+
+        nodes.append((
+            classes[type(item)],
+            item.tag,
+            {
+                key: _dump_attribute(value, classes)
+                for key, value in item.attrs.items()
+            },
+            children,
+            item.close_tag,
+        ))
+
+    paths = [None] * len(classes)
+    for klass, index in classes.items():
+        paths[index] = f"{klass.__module__}.{klass.__qualname__}"
+
+    return _PREFIX + marshal.dumps((tuple(paths), nodes))
+
+
+def load_element(data: bytes) -> EditorJSElement:
+    """
+        Loads an element which was serialized with `dump_element`.
+        Raises a ValueError if the data was not serialized by (this version of) `dump_element`;
+        callers caching elements should treat this as a cache miss.
+    """
+    if not data.startswith(_PREFIX):
+        raise ValueError("Data was not serialized with this version of dump_element")
+
+    try:
+        paths, nodes = marshal.loads(memoryview(data)[len(_PREFIX):])
+    except (EOFError, TypeError) as e:
+        raise ValueError("Invalid serialized element") from e
+
+    classes = [_import_class(path) for path in paths]
+    built = [None] * len(nodes)
+    # Children are stored after their parents; build them first.
+    for i in range(len(nodes) - 1, -1, -1):
+        class_index, tag, attrs, children, close_tag = nodes[i]
+
+        element = classes[class_index].__new__(classes[class_index])
+        element.tag = tag
+        element.attrs = {
+            key: _load_attribute(value, classes)
+            for key, value in attrs.items()
+        }
+        element._content = [
+            built[child] if type(child) is int else child
+            for child in children
+        ]
+        element.close_tag = close_tag
+        built[i] = element
+
+    return built[0]
+
+
+def _dump_attribute(value: Any, classes: dict[type, int]) -> Union[str, int, float, tuple]:
+    if isinstance(value, EditorJSElementAttribute) and _get_class_index(value, classes) is not None:
+        attr_value = value._value
+        if isinstance(attr_value, OrderedValues):
+            attr_value = [_dump_value(item) for item in attr_value]
+        elif isinstance(attr_value, dict):
+            attr_value = {
+                str(key): _dump_value(item)
+                for key, item in attr_value.items()
+            }
+        else:
+            attr_value = _dump_value(attr_value)
+
+        return (classes[type(value)], attr_value, value.delimiter)
+
+    return _dump_value(value)
+
+
+def _load_attribute(value: Union[str, int, float, tuple], classes: list[type]) -> Any:
+    if type(value) is not tuple:
+        return value
+
+    class_index, attr_value, delimiter = value
+    attribute = classes[class_index].__new__(classes[class_index])
+    if type(attr_value) is list:
+        attr_value = OrderedValues.fromkeys(attr_value)
+
+    attribute._value = attr_value
+    attribute.delimiter = delimiter
+    return attribute
+
+
+def _dump_value(value: Any) -> Union[str, int, float, bool, None]:
+    # Anything else is written with `str()`; so it can be stored as such.
+    if type(value) in _PLAIN_TYPES:
+        return value
+    return str.__str__(str(value))
+
+
+def _get_class_index(value: Union[EditorJSElement, EditorJSElementAttribute], classes: dict[type, int]) -> Union[int, None]:
+    """
+        Returns the index of the value's class in the class table, adding it if needed.
+        Returns None if the value cannot be rebuilt from it's tag, attributes and content (or value) alone.
+    """
+    klass = type(value)
+    if getattr(value, "__dict__", None) or not _is_serializable_class(klass):
+        return None
+
+    if isinstance(value, EditorJSElement) and not isinstance(getattr(value, "attrs", None), dict):
+        return None
+
+    if klass not in classes:
+        classes[klass] = len(classes)
+
+    return classes[klass]
+
+
+@functools.cache
+def _is_serializable_class(klass: type) -> bool:
+    # Only classes defined at module level can be imported again.
+    if "." in klass.__qualname__:
+        return False
+
+    base_slots = _ELEMENT_SLOTS if issubclass(klass, EditorJSElement) else _ATTRIBUTE_SLOTS
+    for base in klass.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+
+        if not base_slots.issuperset(slots):
+            return False
+
+    return True
+
+
+@functools.cache
+def _import_class(path: str) -> type:
+    try:
+        klass = import_string(path)
+    except ImportError as e:
+        raise ValueError(f"Cannot import {path}") from e
+
+    if not isinstance(klass, type) or not issubclass(klass, (EditorJSElement, EditorJSElementAttribute)):
+        raise ValueError(f"{path} is not an element or attribute class")
+    return klass
@@ -7,16 +7,38 @@ from .attrs import (
     EditorJSElementAttribute,
     EditorJSStyleAttribute,
 )
+from ... import settings
 
+import bs4
 
-def make_attrs(attrs: dict[str, Any]) -> str:
 
-    attrs = {
-        key: _make_attr(value)
-        for key, value in attrs.items()
-    }
+DOCUMENT_TAGS = ("html", "head", "body")
+
+
+def parse_html(html: str) -> bs4.BeautifulSoup:
+    """
+        Parses a HTML fragment with the parser configured by `EDITORJS_HTML_PARSER`.
+        Parsers which always build a full document (like lxml)
+        have the html, head and body tags they added removed again.
+    """
+    soup = bs4.BeautifulSoup(html, settings.HTML_PARSER)
+    if settings.HTML_PARSER == "html.parser":
+        return soup
 
-    return " ".join([f'{key}="{value}"' for key, value in attrs.items()])
+    for name in DOCUMENT_TAGS:
+        tag = soup.find(name)
+        if tag is not None:
+            tag.unwrap()
+
+    return soup
+
+
+def make_attrs(attrs: dict[str, Any]) -> str:
+    # Plain strings are written as is; no attribute object is created for them.
+    return " ".join([
+        f'{key}="{value if isinstance(value, str) else _make_attr(value)}"'
+        for key, value in attrs.items()
+    ])
 
 
 def wrap_tag(tag_name, attrs, content = None, close_tag = True):
@@ -7,6 +7,10 @@ from typing import Any, Union
 from wagtail import hooks
 
 import copy
+import hashlib
+import json
+from .. import __version__
+from ..instrumentation import record
 from ..hooks import (
     REGISTER_HOOK_NAME,
 )
@@ -35,6 +39,7 @@ class EditorJSFeatures:
         self.tunes_for_all: list[str] = []
         self.tunes_for_tools: defaultdict[str, list[str]] = defaultdict(list)
         self._looked_for_features = False
+        self._fingerprints: dict[tuple[str], str] = {}
 
 
     def __contains__(self, tool_name: str):
@@ -69,6 +74,7 @@ class EditorJSFeatures:
             providing the `tool_name` into `features` for widgets and fields.
         """
         self.features[tool_name] = feature
+        self._fingerprints.clear()
         if isinstance(feature, InlineEditorJSFeature):
             self.inline_features.append(feature)
 
@@ -83,6 +89,7 @@ class EditorJSFeatures:
             This tune will be made available to only that tool (unless otherwise specified)
             If not providing a `tool_name`; the tune will be available to all tools.
         """
+        self._fingerprints.clear()
         if tool_name:
             self.tunes_for_tools[tool_name].append(tune_name)
         else:
@@ -95,6 +102,42 @@ class EditorJSFeatures:
         """
         self._look_for_features()
         self.features[tool_name].config.update(config)
+        self._fingerprints.clear()
+
+
+    def fingerprint(self, tools: list[str]) -> str:
+        """
+            Returns a stable hash of the registry configuration for the given tools.
+            This changes whenever one of the tools is (re-)registered or reconfigured,
+            and can be used to invalidate anything cached from their output.
+        """
+        self._look_for_features()
+        tools = tuple(tools)
+        if tools in self._fingerprints:
+            return self._fingerprints[tools]
+
+        parts = [__version__]
+        for tool in tools:
+            feature = self.features[tool]
+            feature_type = type(feature)
+            parts.append([
+                tool,
+                f"{feature_type.__module__}.{feature_type.__qualname__}",
+                sorted(feature.allowed_tags or []),
+                sorted(
+                    (key, sorted(value))
+                    for key, value in (feature.allowed_attributes or {}).items()
+                ),
+                feature.config,
+                self.tunes_for_tools.get(tool, []),
+                tool in self.tunes_for_all,
+            ])
+
+        fingerprint = hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode("utf-8"),
+        ).hexdigest()
+        self._fingerprints[tools] = fingerprint
+        return fingerprint
 
 
     def build_config(self, tools: list[str], context: dict[str, Any] = None):
@@ -198,7 +241,8 @@ class EditorJSFeatures:
                 continue
 
             tool_mapping = features[block_type]
-            block_list[i] = tool_mapping.create_block(tools, item)
+            with record("to_python", block_type):
+                block_list[i] = tool_mapping.create_block(tools, item)
 
         data["blocks"] = block_list
 
@@ -215,6 +259,7 @@ class EditorJSFeatures:
         """
             Filters out unknown features and tunes.
             Return the value back to native format.
+            No feature code is called; so nothing is recorded.
         """
         self._look_for_features()
         block_list = data.get("blocks", [])
@@ -282,11 +327,13 @@ class EditorJSFeatures:
                     tunes = item.get("tunes", {})
                     tune = tunes.get(tool)
                     if tune:
-                        tool_mapping.validate(tune)
+                        with record("validate", tool):
+                            tool_mapping.validate(tune)
 
                 else:
                     if item["type"] == tool:
-                        tool_mapping.validate(item)
+                        with record("validate", tool):
+                            tool_mapping.validate(item)
 
         data["blocks"] = block_list
 
@@ -7,9 +7,12 @@ from .basic import (
     EditorJSFeature,
     EditorJSJavascriptFeature,
     EditorJSTune,
+    prefetch_blocks,
+    aprefetch_blocks,
 )
 from .inlines import (
     InlineEditorJSFeature,
+    InlineDispatcher,
     ModelInlineEditorJSFeature,
 )
 from .view import (
@@ -1,6 +1,13 @@
 from typing import Any, Union
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import sync_to_async
 from django import forms
+from django.db import models
+import asyncio
 
+from ...instrumentation import record
 from ..element import EditorJSElement
 from ..value import EditorJSBlock
 from .base import BaseEditorJSFeature
@@ -19,8 +26,117 @@ class EditorJSJavascriptFeature(BaseEditorJSFeature):
         return None
 
 
+_prefetched: ContextVar[dict["EditorJSFeature", dict]] = ContextVar(
+    "wagtail_editorjs_prefetched", default=None,
+)
+
+
+def _group_blocks(features: dict[str, "EditorJSFeature"], blocks: list[EditorJSBlock]) -> dict["EditorJSFeature", list[EditorJSBlock]]:
+    blocks_by_type = defaultdict(list)
+    for block in blocks:
+        blocks_by_type[block["type"]].append(block)
+
+    grouped = {}
+    for block_type, feature_blocks in blocks_by_type.items():
+        feature = features.get(block_type)
+        if isinstance(feature, EditorJSFeature):
+            grouped[feature] = feature_blocks
+
+    return grouped
+
+
+@contextmanager
+def prefetch_blocks(features: dict[str, "EditorJSFeature"], blocks: list[EditorJSBlock], context = None, prefetched: dict = None):
+    """
+        Calls `prefetch` on every feature with all of it's blocks.
+        The prefetched data is available to `render_block_data` until the context manager exits.
+        If `prefetched` is passed (see `aprefetch_blocks`) it is used instead.
+    """
+    if prefetched is None:
+        prefetched = {}
+        for feature, feature_blocks in _group_blocks(features, blocks).items():
+            with record("prefetch", feature.tool_name):
+                data = feature.prefetch(feature_blocks, context)
+            if data is not None:
+                prefetched[feature] = data
+
+    token = _prefetched.set(prefetched)
+    try:
+        yield prefetched
+    finally:
+        _prefetched.reset(token)
+
+
+async def aprefetch_blocks(features: dict[str, "EditorJSFeature"], blocks: list[EditorJSBlock], context = None) -> dict:
+    """
+        Calls `aprefetch` on every feature with all of it's blocks concurrently.
+        Returns the prefetched data; pass it to `prefetch_blocks` to make it available when rendering.
+    """
+    grouped = list(_group_blocks(features, blocks).items())
+    results = await asyncio.gather(*[
+        _aprefetch(feature, feature_blocks, context)
+        for feature, feature_blocks in grouped
+    ])
+    return {
+        feature: data
+        for (feature, _), data in zip(grouped, results)
+        if data is not None
+    }
+
+
+async def _aprefetch(feature: "EditorJSFeature", blocks: list[EditorJSBlock], context = None):
+    # Queries can not be attributed to a feature when ran concurrently.
+    with record("prefetch", feature.tool_name, count_queries=False):
+        return await feature.aprefetch(blocks, context)
+
+
 class EditorJSFeature(BaseEditorJSFeature):
 
+    def prefetch(self, blocks: list[EditorJSBlock], context = None) -> Union[dict, None]:
+        """
+            Load any data needed to render the blocks in bulk.
+            This receives all blocks for this feature in a document before any of them are rendered.
+            The returned mapping is available in `render_block_data` through `get_prefetched`.
+        """
+        return None
+
+    async def aprefetch(self, blocks: list[EditorJSBlock], context = None) -> Union[dict, None]:
+        """
+            Async version of `prefetch` used by `arender_editorjs_html`.
+            Override this to load data with the async ORM;
+            by default `prefetch` is ran in a thread.
+        """
+        return await sync_to_async(self.prefetch)(blocks, context)
+
+    def prefetch_model(self, model: type[models.Model], ids: list[Any]) -> dict[str, models.Model]:
+        """
+            Loads the objects of `model` for the given IDs in one query.
+            The objects are keyed by their ID as a string; IDs in the block data might be strings or integers.
+        """
+        return {
+            str(id): obj
+            for id, obj in model._default_manager.in_bulk(ids).items()
+        }
+
+    async def aprefetch_model(self, model: type[models.Model], ids: list[Any]) -> dict[str, models.Model]:
+        """
+            Async version of `prefetch_model`; loads the objects with the async ORM.
+        """
+        return {
+            str(id): obj
+            for id, obj in (await model._default_manager.ain_bulk(ids)).items()
+        }
+
+    def get_prefetched(self) -> Union[dict, None]:
+        """
+            Returns the data returned by `prefetch` for the current render.
+            Returns None if nothing was prefetched; `render_block_data` should then fetch it's own data.
+        """
+        prefetched = _prefetched.get()
+        if not prefetched:
+            return None
+        return prefetched.get(self)
+
     def validate(self, data: Any):
         """
             Perform basic validation for an EditorJS block feature.
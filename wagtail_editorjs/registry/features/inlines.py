@@ -1,9 +1,13 @@
 from typing import Any, Union
+from collections import defaultdict
+from asgiref.sync import sync_to_async
 from django.utils.functional import cached_property
 
 from ...settings import USE_FULL_URLS
+from ...instrumentation import record
 from .base import BaseEditorJSFeature
 
+import asyncio
 import bs4
 
 
@@ -54,6 +58,46 @@ class InlineEditorJSFeature(BaseEditorJSFeature):
         self.must_have_attrs = must_have_attrs
         self.can_have_attrs = can_have_attrs
 
+    @cached_property
+    def has_custom_matching(self) -> bool:
+        """
+        Whether this feature overrides how elements are found in the soup.
+        """
+        return any(
+            getattr(type(self), name) is not getattr(InlineEditorJSFeature, name)
+            for name in ("filter", "find_inline_data", "parse_inline_data")
+        )
+
+    @cached_property
+    def markers(self) -> Union[tuple[str], None]:
+        """
+        Lowercased strings which must all occur in a piece of HTML for this feature to find any elements in it.
+        These are the opening tag and the names of the must_have_attrs.
+        Returns None if the feature can never match anything.
+        """
+        if self.has_custom_matching:
+            # Custom matching could find anything with this tag.
+            if self.tag_name:
+                return (f"<{self.tag_name.lower()}",)
+            return ()
+
+        if not self.tag_name:
+            return None
+
+        return (f"<{self.tag_name.lower()}",) + tuple(
+            key.lower() for key in self.must_have_attrs.keys()
+        )
+
+    def has_markers(self, html: str) -> bool:
+        """
+        Checks if all markers occur in the (lowercased) HTML.
+        """
+        markers = self.markers
+        if markers is None:
+            return False
+
+        return all(marker in html for marker in markers)
+
     def build_elements(self, inline_data: list, context: dict[str, Any] = None) -> list:
         """
         Builds the elements for the inline data.
@@ -89,6 +133,35 @@ class InlineEditorJSFeature(BaseEditorJSFeature):
 
         return True
 
+    def find_inline_data(self, soup: bs4.BeautifulSoup) -> list[tuple[bs4.Tag, dict[str, Any]]]:
+        """
+        Finds inline elements by the must_have_attrs and can_have_attrs.
+        Returns a list of (element, attributes) tuples.
+        """
+        matches: dict[Any, dict[str, Any]] = {}
+        elements = soup.find_all(self.filter)
+        for item in elements:
+            matches[item] = self.get_inline_attrs(item)
+
+        return list(matches.items())
+
+    def get_inline_attrs(self, item: bs4.Tag) -> dict[str, Any]:
+        """
+        Returns the must_have_attrs and can_have_attrs of a matched element.
+        """
+        attrs = {}
+        for key in self.must_have_attrs.keys():
+            attrs[key] = item.get(key)
+
+        for key, value in self.can_have_attrs.items():
+            v = item.get(key)
+            if v:
+                attrs[key] = v
+            elif item.has_attr(key):
+                attrs[key] = True
+
+        return attrs
+
     def parse_inline_data(self, soup: bs4.BeautifulSoup, context=None):
         """
         Finds inline elements by the must_have_attrs and can_have_attrs.
@@ -97,27 +170,33 @@ class InlineEditorJSFeature(BaseEditorJSFeature):
 
         I.E. For a link; this would gather all page ID's and fetch them in a single query.
         """
-
-        matches: dict[Any, dict[str, Any]] = {}
-        elements = soup.find_all(self.filter)
-        if not elements:
+        inline_data = self.find_inline_data(soup)
+        if not inline_data:
             return None
 
-        for item in elements:
-            matches[item] = {}
+        # Build all inlines.
+        self.build_elements(inline_data, context=context)
 
-            for key in self.must_have_attrs.keys():
-                matches[item][key] = item.get(key)
+    async def aparse_inline_data(self, soup: bs4.BeautifulSoup, context=None):
+        """
+        Async version of `parse_inline_data` used by `arender_editorjs_html`.
+        Any changes to the soup must be made from (thread sensitive) sync code.
+        """
+        if type(self).parse_inline_data is not InlineEditorJSFeature.parse_inline_data:
+            return await sync_to_async(self.parse_inline_data)(soup, context)
 
-            for key, value in self.can_have_attrs.items():
-                v = item.get(key)
-                if v:
-                    matches[item][key] = v
-                elif item.has_attr(key):
-                    matches[item][key] = True
+        inline_data = await sync_to_async(self.find_inline_data)(soup)
+        if not inline_data:
+            return None
 
-        # Build all inlines.
-        self.build_elements(list(matches.items()), context=context)
+        await self.abuild_elements(inline_data, context=context)
+
+    async def abuild_elements(self, inline_data: list, context: dict[str, Any] = None):
+        """
+        Async version of `build_elements`.
+        By default `build_elements` is ran in a thread.
+        """
+        return await sync_to_async(self.build_elements)(inline_data, context=context)
 
     @classmethod
     def get_test_data(cls) -> list[tuple[str, str]]:
@@ -135,6 +214,84 @@ class InlineEditorJSFeature(BaseEditorJSFeature):
         return []
 
 
+class InlineDispatcher:
+    """
+    Finds the elements of many inline features in a single walk over the soup.
+    Features are indexed by their tag name; each element is checked
+    against the required attributes of the features for it's tag in order.
+    The first feature which matches an element gets it.
+
+    Features with custom matching are parsed on their own; after the dispatched features are built.
+    """
+
+    def __init__(self, inlines: list[InlineEditorJSFeature]):
+        self.inlines = inlines
+        self.by_tag: dict[str, list[InlineEditorJSFeature]] = defaultdict(list)
+        self.custom: list[InlineEditorJSFeature] = []
+
+        for inline in inlines:
+            if inline.has_custom_matching:
+                self.custom.append(inline)
+            elif inline.tag_name:
+                self.by_tag[inline.tag_name].append(inline)
+
+    def find(self, soup: bs4.BeautifulSoup) -> dict[InlineEditorJSFeature, list[tuple[bs4.Tag, dict[str, Any]]]]:
+        """
+        Returns the inline data for every dispatched feature which matched any elements.
+        """
+        matches: dict[InlineEditorJSFeature, list] = defaultdict(list)
+        if not self.by_tag:
+            return matches
+
+        for item in soup.find_all(list(self.by_tag.keys())):
+            for inline in self.by_tag[item.name]:
+                if inline.filter(item):
+                    matches[inline].append((item, inline.get_inline_attrs(item)))
+                    break
+
+        return matches
+
+    def parse(self, soup: bs4.BeautifulSoup, context=None):
+        """
+        Finds and builds the elements of all inlines.
+        """
+        matches = self.find(soup)
+        for inline, inline_data in matches.items():
+            with record("inline", inline.tool_name) as inline_record:
+                inline.build_elements(inline_data, context=context)
+                if inline_record is not None:
+                    inline_record.size = _inline_size(inline_data)
+
+        for inline in self.custom:
+            with record("inline", inline.tool_name):
+                inline.parse_inline_data(soup, context)
+
+    async def aparse(self, soup: bs4.BeautifulSoup, context=None):
+        """
+        Async version of `parse`; the inlines are built concurrently.
+        """
+        matches = await sync_to_async(self.find)(soup)
+        await asyncio.gather(*[
+            self._abuild_elements(inline, inline_data, context)
+            for inline, inline_data in matches.items()
+        ])
+
+        for inline in self.custom:
+            with record("inline", inline.tool_name, count_queries=False):
+                await inline.aparse_inline_data(soup, context)
+
+    async def _abuild_elements(self, inline: InlineEditorJSFeature, inline_data: list, context=None):
+        # Queries can not be attributed to an inline when ran concurrently.
+        with record("inline", inline.tool_name, count_queries=False) as inline_record:
+            await inline.abuild_elements(inline_data, context=context)
+            if inline_record is not None:
+                inline_record.size = _inline_size(inline_data)
+
+
+def _inline_size(inline_data: list) -> int:
+    return sum(len(str(item)) for item, _ in inline_data)
+
+
 class ModelInlineEditorJSFeature(InlineEditorJSFeature):
     model = None
     chooser_class = None
@@ -206,14 +363,12 @@ class ModelInlineEditorJSFeature(InlineEditorJSFeature):
     def get_full_url(cls, instance, request):
         return request.build_absolute_uri(cls.get_url(instance))
 
-    def build_elements(self, inline_data: list, context: dict[str, Any] = None) -> list:
+    def get_inline_ids(self, inline_data: list, context: dict[str, Any] = None) -> list[tuple[Any, Any, dict[str, Any]]]:
         """
-        Process the bulk data; fetch all pages in one go
-        and build the elements.
+        Returns a list of (item, id, data) tuples for the inline data.
+        The attributes of the items are removed.
         """
-        super().build_elements(inline_data, context=context)
         ids = []
-        # element_soups = []
         for data in inline_data:
             # soup: BeautifulSoup
             # element: EditorJSElement
@@ -231,11 +386,36 @@ class ModelInlineEditorJSFeature(InlineEditorJSFeature):
             for key in list(item.attrs.keys()):
                 del item[key]
 
-        # Fetch all objects
-        objects = self.model.objects.in_bulk([id for _, id, _ in ids])
+        return ids
+
+    def build_model_elements(self, ids: list[tuple[Any, Any, dict[str, Any]]], objects: dict[Any, Any], context: dict[str, Any] = None):
         for item, id, data in ids:
             self.build_element(item, objects[id], context, data)
 
+    def build_elements(self, inline_data: list, context: dict[str, Any] = None) -> list:
+        """
+        Process the bulk data; fetch all pages in one go
+        and build the elements.
+        """
+        super().build_elements(inline_data, context=context)
+        ids = self.get_inline_ids(inline_data, context)
+
+        # Fetch all objects
+        objects = self.model.objects.in_bulk([id for _, id, _ in ids])
+        self.build_model_elements(ids, objects, context)
+
+    async def abuild_elements(self, inline_data: list, context: dict[str, Any] = None):
+        """
+        Fetches the objects with the async ORM.
+        """
+        if type(self).build_elements is not ModelInlineEditorJSFeature.build_elements:
+            # Custom build_elements might do anything; run it in a thread.
+            return await super().abuild_elements(inline_data, context)
+
+        ids = await sync_to_async(self.get_inline_ids)(inline_data, context)
+        objects = await self.model.objects.ain_bulk([id for _, id, _ in ids])
+        await sync_to_async(self.build_model_elements)(ids, objects, context)
+
     def get_css(self):
         return self.widget.media._css.get("all", []) + super().get_css()
 
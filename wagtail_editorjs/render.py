@@ -1,21 +1,261 @@
 from typing import Any, Union
-from collections import defaultdict
-from django.template.loader import render_to_string
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import get_template, render_to_string
 from django.template.context import Context
+from django.db.models import Model, QuerySet
+from django.utils.html import conditional_escape
 from django.utils.safestring import mark_safe
 from . import settings
+from .sanitizer import (
+    NullSanitizer,
+    get_policy,
+)
+from .cache import (
+    get_render_cache,
+    get_cache_key,
+    get_block_cache,
+    get_block_cache_key,
+    get_options_hash,
+    hash_data,
+)
 from .registry import (
     EditorJSElement,
     InlineEditorJSFeature,
+    InlineDispatcher,
     EDITOR_JS_FEATURES,
+    parse_html,
+    prefetch_blocks,
+    aprefetch_blocks,
+)
+from .instrumentation import (
+    instrument_render,
+    record,
 )
-import bleach, bs4
+from asgiref.sync import sync_to_async
+import bs4
+import functools
+import os
+import uuid
+
+
+FRAGMENT_TAG = "editorjs-fragment"
+
+RICH_TEXT_TEMPLATE = "wagtail_editorjs/rich_text.html"
+
+DEFAULT_RICH_TEXT_TEMPLATE = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "templates", RICH_TEXT_TEMPLATE,
+))
+
+STREAM_BATCH_SIZE = 100
+
+_MISSING = object()
+
+
+def parse_inline_fragments(fragments: list[str], inlines: list[InlineEditorJSFeature], context=None) -> list[str]:
+    """
+        Runs the inline features over the given HTML fragments.
+        Each fragment is placed in it's own container inside of a single soup;
+        this way inlines can still fetch all their objects in one go.
+        Returns the fragments in the same order they were passed in.
+    """
+    inlines = _get_fragment_inlines(fragments, inlines)
+    if not inlines:
+        return list(fragments)
+
+    soup, containers = _build_fragment_soup(fragments)
+
+    # Give inlines access to all fragments at once.
+    # This allows for proper parsing of say; page or document links.
+    InlineDispatcher(inlines).parse(soup, context)
+
+    return _decode_fragments(containers)
+
+
+async def aparse_inline_fragments(fragments: list[str], inlines: list[InlineEditorJSFeature], context=None) -> list[str]:
+    """
+        Async version of `parse_inline_fragments`.
+        The inlines are ran concurrently; any objects they fetch with the async ORM are loaded at the same time.
+    """
+    inlines = _get_fragment_inlines(fragments, inlines)
+    if not inlines:
+        return list(fragments)
+
+    soup, containers = await sync_to_async(_build_fragment_soup)(fragments)
+
+    await InlineDispatcher(inlines).aparse(soup, context)
+
+    return await sync_to_async(_decode_fragments)(containers)
+
+
+def _get_fragment_inlines(fragments: list[str], inlines: list[InlineEditorJSFeature]) -> list[InlineEditorJSFeature]:
+    """
+        Returns the inlines which might find elements in any of the fragments.
+    """
+    lowered = [fragment.lower() for fragment in fragments]
+    return [
+        inline
+        for inline in inlines
+        if any(inline.has_markers(fragment) for fragment in lowered)
+    ]
+
+
+def _build_fragment_soup(fragments: list[str]) -> tuple[bs4.BeautifulSoup, list[bs4.Tag]]:
+    soup = bs4.BeautifulSoup("", "html.parser")
+    containers = []
+    for fragment in fragments:
+        container = soup.new_tag(FRAGMENT_TAG)
+        container.extend(parse_html(fragment).contents)
+        soup.append(container)
+        containers.append(container)
+
+    return soup, containers
+
+
+def _decode_fragments(containers: list[bs4.Tag]) -> list[str]:
+    return [
+        container.decode_contents()
+        for container in containers
+    ]
+
+
+def render_block(feature_mappings: dict[str, Any], block: dict, context = None) -> Union[EditorJSElement, None]:
+    """
+        Renders a single block and applies it's tunes.
+        Returns None if the block should not be rendered.
+    """
+    feature: str = block["type"]
+    tunes: dict[str, Any] = block.get("tunes", {})
+    feature_mapping = feature_mappings.get(feature, None)
+
+    if not feature_mapping:
+        return None
+
+    # Build the actual block.
+    with record("feature", feature) as feature_record:
+        element: EditorJSElement = feature_mapping.render_block_data(block, context)
+        if feature_record is not None and element is not None:
+            feature_record.size = len(str(element))
+
+    # Optionally tools can decide to not render the block.
+    if element is None:
+        return None
+
+    # Tune the element.
+    for tune_name, tune_value in tunes.items():
+        if tune_name not in feature_mappings:
+            continue
+
+        with record("tune", tune_name) as tune_record:
+            element = feature_mappings[tune_name].tune_element(element, tune_value, context)
+            if tune_record is not None:
+                tune_record.size = len(str(element))
+
+    # Add the block ID to each individual block.
+    if settings.ADD_BLOCK_ID:
+        # This can be used to link frontend to the admin area.
+        element.attrs[settings.BLOCK_ID_ATTR] = block.get("id", "")
+
+    return element
+
+
+def write_blocks(feature_mappings: dict[str, Any], blocks: list[dict], inlines: list[InlineEditorJSFeature], context = None, fragments: list[Union[str, None]] = None) -> tuple[list[str], list[int], list[int]]:
+    """
+        Writes all blocks into one shared buffer.
+        Only blocks which contain the markers of one of the inlines are collapsed into
+        a single string; their indices in the buffer are returned alongside it.
+        The index in the buffer where each written block starts is returned last;
+        blocks are separated by a single newline.
+        If `fragments` is passed it holds the (cached) HTML of each block or None;
+        blocks without HTML are rendered and their HTML is stored in it.
+    """
+    html = []
+    inline_fragments = []
+    starts = []
+    for i, block in enumerate(blocks):
+        element = None
+        fragment = fragments[i] if fragments is not None else None
+        if fragment is None:
+            element = render_block(feature_mappings, block, context)
+            if fragments is not None:
+                fragment = fragments[i] = str(element) if element is not None else ""
+
+        if fragment is not None:
+            # Blocks which are not rendered are stored as an empty string.
+            if not fragment:
+                continue
+        elif element is None:
+            continue
+
+        if html:
+            html.append("\n")
+
+        start = len(html)
+        starts.append(start)
+        if fragment is not None:
+            html.append(fragment)
+        else:
+            element.write(html)
+
+        if inlines:
+            fragment = "".join(html[start:])
+            lowered = fragment.lower()
+            if any(inline.has_markers(lowered) for inline in inlines):
+                html[start:] = [fragment]
+                inline_fragments.append(start)
+
+    return html, inline_fragments, starts
+
+
+@functools.cache
+def is_wrapper_overridden() -> bool:
+    """
+        Checks (once) if the project overrides the `rich_text.html` template.
+    """
+    template = get_template(RICH_TEXT_TEMPLATE)
+    origin = getattr(template, "origin", None)
+    if origin is None or not origin.name:
+        return True
+
+    return os.path.normpath(os.path.abspath(origin.name)) != DEFAULT_RICH_TEXT_TEMPLATE
+
+
+@receiver(setting_changed)
+def _clear_wrapper_overridden(setting, **kwargs):
+    if setting == "TEMPLATES":
+        is_wrapper_overridden.cache_clear()
+
+
+def wrap_html(html: str, context = None) -> str:
+    """
+        Wraps the rendered HTML in the `rich_text.html` template.
+        The template engine is only used if the template is overridden;
+        otherwise the same markup is built directly.
+    """
+    if not is_wrapper_overridden():
+        block_id = context.get("block_id") if context else None
+        if block_id:
+            block_id = f' data-block-id="{conditional_escape(block_id)}"'
+        else:
+            block_id = ""
 
+        return mark_safe(
+            f'<div{block_id} class="wagtail-editorjs-richtext">\n    {html}\n</div>'
+        )
+
+    if isinstance(context, Context):
+        ctx = context.flatten()
+    else:
+        ctx = dict(context or {})
+
+    ctx["html"] = html
+
+    return render_to_string(
+        RICH_TEXT_TEMPLATE,
+        context=ctx,
+        request=ctx.get("request", None)
+    )
 
-class NullSanitizer:
-    @staticmethod
-    def sanitize_css(val):
-        return val
 
 def render_editorjs_html(
         features: list[str],
@@ -23,121 +263,564 @@ def render_editorjs_html(
         context=None,
         clean: bool = None,
         whitelist_tags: list[str] = None,
-        whitelist_attrs: Union[dict, list] = None
+        whitelist_attrs: Union[dict, list] = None,
+        cache: bool = None,
+        block_cache: bool = None,
     ) -> str:
     """
         Renders the editorjs widget based on the features provided.
+        The output is stored in the render cache if it is enabled;
+        the HTML of each block is stored in the block cache if that is enabled.
     """
+    return render_editorjs_many(
+        [data], features, context, clean, whitelist_tags, whitelist_attrs, cache, block_cache,
+    )[0]
+
 
-    if "blocks" not in data:
-        data["blocks"] = []
+def render_editorjs_many(
+        values: list[dict],
+        features: list[str],
+        context=None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+        cache: bool = None,
+        block_cache: bool = None,
+    ) -> list[str]:
+    """
+        Renders multiple editorjs values with the same features.
+        Objects referenced by blocks and inlines are fetched once for all values together.
+        Returns the rendered HTML in the same order as the values.
+    """
+    render_cache = get_render_cache(cache)
+    keys = _get_document_cache_keys(
+        values, features, context, clean, whitelist_tags, whitelist_attrs, render_cache,
+    )
+    cached = render_cache.get_many(set(keys)) if keys else {}
+    rendered, missing = _get_cached_documents(len(values), keys, cached)
+    if not missing:
+        return rendered
 
+    with instrument_render(context):
+        documents = _render_documents(
+            features,
+            [values[i] for i in missing],
+            context,
+            clean,
+            whitelist_tags,
+            whitelist_attrs,
+            block_cache,
+        )
+
+    new_documents = _set_rendered_documents(rendered, missing, documents, keys)
+    if new_documents:
+        render_cache.set_many(new_documents, settings.RENDER_CACHE_TIMEOUT)
+
+    return rendered
+
+
+async def arender_editorjs_html(
+        features: list[str],
+        data: dict,
+        context=None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+        cache: bool = None,
+        block_cache: bool = None,
+    ) -> str:
+    """
+        Async version of `render_editorjs_html`.
+        Features can load their data with the async ORM by implementing `aprefetch`;
+        the data for different features is loaded concurrently.
+    """
+    rendered = await arender_editorjs_many(
+        [data], features, context, clean, whitelist_tags, whitelist_attrs, cache, block_cache,
+    )
+    return rendered[0]
+
+
+async def arender_editorjs_many(
+        values: list[dict],
+        features: list[str],
+        context=None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+        cache: bool = None,
+        block_cache: bool = None,
+    ) -> list[str]:
+    """
+        Async version of `render_editorjs_many`.
+    """
+    render_cache = get_render_cache(cache)
+    keys = _get_document_cache_keys(
+        values, features, context, clean, whitelist_tags, whitelist_attrs, render_cache,
+    )
+    cached = await render_cache.aget_many(set(keys)) if keys else {}
+    rendered, missing = _get_cached_documents(len(values), keys, cached)
+    if not missing:
+        return rendered
+
+    with instrument_render(context):
+        documents = await _arender_documents(
+            features,
+            [values[i] for i in missing],
+            context,
+            clean,
+            whitelist_tags,
+            whitelist_attrs,
+            block_cache,
+        )
+
+    new_documents = _set_rendered_documents(rendered, missing, documents, keys)
+    if new_documents:
+        await render_cache.aset_many(new_documents, settings.RENDER_CACHE_TIMEOUT)
+
+    return rendered
+
+
+def _get_document_cache_keys(
+        values: list[dict],
+        features: list[str],
+        context=None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+        render_cache = None,
+    ) -> Union[list[str], None]:
+    """
+        Prepares the values for rendering; returns their render cache keys.
+        Returns None if the render cache is not used.
+    """
+    for data in values:
+        if "blocks" not in data:
+            data["blocks"] = []
+
+    if render_cache is None:
+        return None
+
+    return [
+        get_cache_key(features, data, context, clean, whitelist_tags, whitelist_attrs)
+        for data in values
+    ]
+
+
+def _get_cached_documents(count: int, keys: Union[list[str], None], cached: dict[str, str]) -> tuple[list[Union[str, None]], list[int]]:
+    """
+        Returns the cached HTML of every document (None if it was not cached) and the indices of the missing documents.
+    """
+    rendered = [None] * count
+    if keys is not None:
+        for i, key in enumerate(keys):
+            if key in cached:
+                rendered[i] = mark_safe(cached[key])
+
+    missing = [
+        i for i, html in enumerate(rendered)
+        if html is None
+    ]
+    return rendered, missing
+
+
+def _set_rendered_documents(rendered: list[Union[str, None]], missing: list[int], documents: list[str], keys: Union[list[str], None]) -> dict[str, str]:
+    """
+        Fills in the rendered documents; returns what should be stored in the render cache.
+    """
+    for i, html in zip(missing, documents):
+        rendered[i] = html
+
+    if keys is None:
+        return {}
+
+    return {
+        keys[i]: str(rendered[i])
+        for i in missing
+    }
+
+
+def _get_render_features(features: list[str]) -> tuple[dict[str, Any], list[InlineEditorJSFeature]]:
     feature_mappings = {
         feature: EDITOR_JS_FEATURES[feature]
         for feature in features
     }
 
+    # Inlines which can never match anything are skipped.
     inlines = [
         feature
         for feature in feature_mappings.values()
-        if isinstance(feature, InlineEditorJSFeature)
+        if isinstance(feature, InlineEditorJSFeature) and feature.markers is not None
     ]
 
-    html = []
-    for block in data["blocks"]:
+    return feature_mappings, inlines
 
-        feature: str = block["type"]
-        tunes: dict[str, Any] = block.get("tunes", {})
-        feature_mapping = feature_mappings.get(feature, None)
 
-        if not feature_mapping:
-            continue
+def _get_render_policy(features: list[str], clean: bool = None, whitelist_tags: list[str] = None, whitelist_attrs: Union[dict, list] = None):
+    if clean or (clean is None and settings.CLEAN_HTML):
+        return get_policy(
+            features, whitelist_tags, whitelist_attrs,
+        )
+    return None
 
-        # Build the actual block.
-        element: EditorJSElement = feature_mapping.render_block_data(block, context)
 
-        # Optionally tools can decide to not render the block.
-        if element is None:
-            continue
+def _render_documents(
+        features: list[str],
+        values: list[dict],
+        context=None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+        block_cache: bool = None,
+    ) -> list[str]:
 
-        # Tune the element.
-        for tune_name, tune_value in tunes.items():
-            if tune_name not in feature_mappings:
-                continue
+    feature_mappings, inlines = _get_render_features(features)
 
-            element = feature_mappings[tune_name].tune_element(element, tune_value, context)
+    block_cache = get_block_cache(block_cache)
+    keys = _get_block_cache_keys(feature_mappings, values, context, block_cache)
+    cached = block_cache.get_many(_get_unique_keys(keys)) if keys is not None else {}
+    fragments = _get_cached_fragments(keys, cached)
 
-        # Add the block ID to each individual block.
-        if settings.ADD_BLOCK_ID:
-            # This can be used to link frontend to the admin area.
-            element.attrs[settings.BLOCK_ID_ATTR] = block.get("id", "")
-        
-        html.append(element)
+    # Allow features to fetch the data for all of their blocks at once.
+    # Only blocks which are not cached are rendered.
+    documents = _write_documents(
+        feature_mappings, values, inlines, context, fragments=fragments,
+    )
 
-    html = "\n".join([str(h) for h in html])
+    new_fragments = _get_new_fragments(keys, fragments, cached)
+    if new_fragments:
+        block_cache.set_many(new_fragments, settings.RENDER_CACHE_TIMEOUT)
 
-    soup = bs4.BeautifulSoup(html, "html.parser")
-    if inlines:
-        for inline in inlines:
-            # Give inlines access to whole soup.
-            # This allows for proper parsing of say; page or document links.
-            inline: InlineEditorJSFeature
-            inline.parse_inline_data(soup, context)
+    # Inlines are parsed for all documents in one go.
+    inline_fragments = _get_inline_fragments(documents)
+    if inline_fragments:
+        _set_inline_fragments(inline_fragments, parse_inline_fragments(
+            [html[i] for html, i in inline_fragments],
+            inlines,
+            context,
+        ))
 
-        # Re-render the soup.
-        html = soup.decode(False)
+    policy = _get_render_policy(
+        features, clean, whitelist_tags, whitelist_attrs,
+    )
 
-    if clean or (clean is None and settings.CLEAN_HTML):
-        allowed_tags = set({
-            # Default inline tags.
-            "i", "b", "strong", "em", "u", "s", "strike"
-        })
-        allowed_attributes = defaultdict(set)
-        # cleaner_funcs = defaultdict(lambda: defaultdict(list))
-
-        for feature in feature_mappings.values():
-            allowed_tags.update(feature.allowed_tags)
-            # for key, value in feature.cleaner_funcs.items():
-            #     for name, func in value.items():
-            #         cleaner_funcs[key][name].append(func)
-
-            for key, value in feature.allowed_attributes.items():
-                allowed_attributes[key].update(value)
-
-        if whitelist_tags:
-            allowed_tags.update(whitelist_tags)
-
-        if "*" in allowed_attributes:
-            allowed_attributes["*"].add(settings.BLOCK_ID_ATTR)
+    return _finish_documents(documents, policy, context)
+
+
+async def _arender_documents(
+        features: list[str],
+        values: list[dict],
+        context=None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+        block_cache: bool = None,
+    ) -> list[str]:
+
+    feature_mappings, inlines = _get_render_features(features)
+
+    block_cache = get_block_cache(block_cache)
+    keys = _get_block_cache_keys(feature_mappings, values, context, block_cache)
+    cached = await block_cache.aget_many(_get_unique_keys(keys)) if keys is not None else {}
+    fragments = _get_cached_fragments(keys, cached)
+
+    prefetched = await aprefetch_blocks(
+        feature_mappings,
+        _get_render_blocks(values, fragments),
+        context,
+    )
+    documents = await sync_to_async(_write_documents)(
+        feature_mappings, values, inlines, context, prefetched, fragments,
+    )
+
+    new_fragments = _get_new_fragments(keys, fragments, cached)
+    if new_fragments:
+        await block_cache.aset_many(new_fragments, settings.RENDER_CACHE_TIMEOUT)
+
+    inline_fragments = _get_inline_fragments(documents)
+    if inline_fragments:
+        _set_inline_fragments(inline_fragments, await aparse_inline_fragments(
+            [html[i] for html, i in inline_fragments],
+            inlines,
+            context,
+        ))
+
+    policy = _get_render_policy(
+        features, clean, whitelist_tags, whitelist_attrs,
+    )
+
+    return await sync_to_async(_finish_documents)(documents, policy, context)
+
+
+def _write_documents(feature_mappings: dict[str, Any], values: list[dict], inlines: list[InlineEditorJSFeature], context = None, prefetched: dict = None, fragments: list[list[Union[str, None]]] = None) -> list[tuple[list[str], list[int], list[int]]]:
+    if fragments is None:
+        fragments = [None] * len(values)
+
+    documents = []
+    with prefetch_blocks(feature_mappings, _get_render_blocks(values, fragments), context, prefetched):
+        for data, document_fragments in zip(values, fragments):
+            documents.append(write_blocks(
+                feature_mappings, data["blocks"], inlines, context, document_fragments,
+            ))
+    return documents
+
+
+def _get_render_blocks(values: list[dict], fragments: list[list[Union[str, None]]] = None) -> list[dict]:
+    """
+        Returns the blocks which still need to be rendered.
+    """
+    if fragments is None:
+        fragments = [None] * len(values)
+
+    return [
+        block
+        for data, document_fragments in zip(values, fragments)
+        for i, block in enumerate(data["blocks"])
+        if document_fragments is None or document_fragments[i] is None
+    ]
+
+
+def _get_block_cache_keys(feature_mappings: dict[str, Any], values: list[dict], context = None, block_cache = None) -> Union[list[list[Union[str, None]]], None]:
+    """
+        Returns the block cache key of every block; None if the block cache is not used.
+        Blocks of unknown features are never rendered; they do not get a key.
+    """
+    if block_cache is None:
+        return None
+
+    return [
+        [
+            get_block_cache_key(feature_mappings, block, context)
+            if block["type"] in feature_mappings else None
+            for block in data["blocks"]
+        ]
+        for data in values
+    ]
+
+
+def _get_unique_keys(keys: list[list[Union[str, None]]]) -> set[str]:
+    return {
+        key
+        for document_keys in keys
+        for key in document_keys
+        if key
+    }
+
+
+def _get_cached_fragments(keys: Union[list[list[Union[str, None]]], None], cached: dict[str, str]) -> Union[list[list[Union[str, None]]], None]:
+    if keys is None:
+        return None
+
+    return [
+        [
+            cached.get(key) if key else ""
+            for key in document_keys
+        ]
+        for document_keys in keys
+    ]
+
+
+def _get_new_fragments(keys: Union[list[list[Union[str, None]]], None], fragments: list[list[Union[str, None]]], cached: dict[str, str]) -> dict[str, str]:
+    if keys is None:
+        return {}
+
+    return {
+        key: fragment
+        for document_keys, document_fragments in zip(keys, fragments)
+        for key, fragment in zip(document_keys, document_fragments)
+        if key and key not in cached
+    }
+
+
+def _get_inline_fragments(documents: list[tuple[list[str], list[int], list[int]]]) -> list[tuple[list[str], int]]:
+    return [
+        (html, i)
+        for html, indices, _ in documents
+        for i in indices
+    ]
+
+
+def _set_inline_fragments(inline_fragments: list[tuple[list[str], int]], parsed: list[str]):
+    for (html, i), fragment in zip(inline_fragments, parsed):
+        html[i] = fragment
+
+
+def _finish_documents(documents: list[tuple[list[str], list[int], list[int]]], policy = None, context = None) -> list[str]:
+    rendered = []
+    for html, _, starts in documents:
+        if policy is not None:
+            # Every block is sanitized on it's own; just like `_render_fragments` does.
+            # This way unclosed tags never spill into the next block and the output is
+            # the same as that of `iter_editorjs_html` and `render_editorjs_incremental`.
+            # Streaming sanitizers are fed the pieces of each block as they were written.
+            with record("sanitize", type(policy.sanitizer).__name__) as sanitize_record:
+                html = "\n".join([
+                    "".join(policy.clean_iter(html[start:end]))
+                    for start, end in _get_block_ranges(starts, len(html))
+                ])
+                if sanitize_record is not None:
+                    sanitize_record.size = len(html)
         else:
-            allowed_attributes["*"] = {settings.BLOCK_ID_ATTR}
-
-        if whitelist_attrs:
-            if isinstance(whitelist_attrs, dict):
-                for key, value in whitelist_attrs.items():
-                    allowed_attributes[key].update(value)
-            else:
-                for key in allowed_attributes:
-                    allowed_attributes[key].update(whitelist_attrs)
-
-        html = bleach.clean(
-            html,
-            tags=allowed_tags,
-            attributes=allowed_attributes,
-            css_sanitizer=NullSanitizer,
+            html = "".join(html)
+
+        with record("wrapper", RICH_TEXT_TEMPLATE) as wrapper_record:
+            html = wrap_html(html, context)
+            if wrapper_record is not None:
+                wrapper_record.size = len(html)
+
+        rendered.append(html)
+
+    return rendered
+
+
+def _get_block_ranges(starts: list[int], length: int) -> list[tuple[int, int]]:
+    """
+        Returns the range of each block in the buffer; without the newline separating it from the next block.
+    """
+    return [
+        (start, starts[i + 1] - 1 if i + 1 < len(starts) else length)
+        for i, start in enumerate(starts)
+    ]
+
+
+def _render_fragments(feature_mappings: dict[str, Any], inlines: list[InlineEditorJSFeature], blocks: list[dict], policy = None, context = None) -> list[Union[str, None]]:
+    """
+        Renders each block into it's own (sanitized) fragment.
+        Blocks which are not rendered are None.
+    """
+    fragments = []
+    inline_indices = []
+    with prefetch_blocks(feature_mappings, blocks, context):
+        for block in blocks:
+            element = render_block(feature_mappings, block, context)
+            if element is None:
+                fragments.append(None)
+                continue
+
+            fragment = str(element)
+            if inlines:
+                lowered = fragment.lower()
+                if any(inline.has_markers(lowered) for inline in inlines):
+                    inline_indices.append(len(fragments))
+
+            fragments.append(fragment)
+
+    if inline_indices:
+        parsed = parse_inline_fragments(
+            [fragments[i] for i in inline_indices],
+            inlines,
+            context,
         )
+        for i, fragment in zip(inline_indices, parsed):
+            fragments[i] = fragment
 
-    ctx = context or {}
-    ctx["html"] = html
+    if policy is not None:
+        fragments = [
+            policy.clean(fragment) if fragment is not None else None
+            for fragment in fragments
+        ]
 
-    if isinstance(context, Context):
-        ctx = context.flatten()
+    return fragments
 
-    return render_to_string(
-        "wagtail_editorjs/rich_text.html",
-        context=ctx,
-        request=ctx.get("request", None)
+
+def split_wrapper(context = None) -> tuple[str, str]:
+    """
+        Renders the `rich_text.html` template around a placeholder.
+        Returns the HTML before and after the placeholder.
+    """
+    placeholder = f"editorjs-stream-{uuid.uuid4().hex}"
+    html = wrap_html(mark_safe(placeholder), context)
+    start, _, end = html.partition(placeholder)
+    return start, end
+
+
+def iter_editorjs_html(
+        features: list[str],
+        data: dict,
+        context=None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ):
+    """
+        Renders the editorjs value block by block.
+        Yields the opening HTML of the wrapper, each (sanitized) block and finally the closing HTML.
+        Blocks are prefetched, rendered and passed to the inlines in batches of `batch_size`;
+        memory is bounded by the rendered HTML of a single batch, not of a single block.
+        Pass `batch_size=1` to keep only one block in memory; at the cost of a prefetch (query) per block.
+        The joined output is the same as that of `render_editorjs_html`, but is never cached;
+        both sanitize every block on it's own, so this holds for malformed HTML as well.
+        This can be used to feed a `StreamingHttpResponse`.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    blocks = data.get("blocks", [])
+    feature_mappings, inlines = _get_render_features(features)
+    policy = _get_render_policy(
+        features, clean, whitelist_tags, whitelist_attrs,
     )
+    start, end = split_wrapper(context)
+
+    yield start
+
+    first = True
+    for offset in range(0, len(blocks), batch_size):
+        batch = blocks[offset:offset + batch_size]
+        for fragment in _render_fragments(feature_mappings, inlines, batch, policy, context):
+            if fragment is None:
+                continue
+
+            if not first:
+                fragment = "\n" + fragment
+
+            first = False
+            yield fragment
+
+    yield end
+
+
+def render_editorjs_queryset(
+        queryset: QuerySet,
+        field_name: str,
+        context=None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+        cache: bool = None,
+        block_cache: bool = None,
+    ) -> list[tuple[Model, str]]:
+    """
+        Renders an `EditorJSField` for all objects in the queryset.
+        Returns a list of `(object, html)` tuples in the order of the queryset.
+        Empty values are rendered as an empty string.
+    """
+    features = queryset.model._meta.get_field(field_name).features
+    objects = list(queryset)
+    values = [
+        getattr(obj, field_name)
+        for obj in objects
+    ]
+    indices = [
+        i for i, value in enumerate(values)
+        if value
+    ]
+    rendered = render_editorjs_many(
+        [values[i] for i in indices],
+        features,
+        context,
+        clean,
+        whitelist_tags,
+        whitelist_attrs,
+        cache,
+        block_cache,
+    )
+
+    html = [mark_safe("")] * len(objects)
+    for i, value in zip(indices, rendered):
+        html[i] = value
+
+    return list(zip(objects, html))
 
 
 
@@ -166,3 +849,106 @@ def render_editorjs_html(
 #                 return True
 #             
 #             return False
+
+
+class RenderedDocument:
+    """
+        The result of `render_editorjs_incremental`.
+        Holds the sanitized HTML of every block alongside it's ID and hash;
+        it can be passed back in to only render the blocks which changed.
+
+        `blocks` is a list of `(block_id, block_hash, html)`; `html` is None if the block was not rendered.
+        `serialize()` returns a JSON serializable dict which can be stored (i.e. in a cache)
+        and be turned back into a document with `RenderedDocument.deserialize()`.
+    """
+
+    def __init__(self, options: str, blocks: list[tuple[str, str, Union[str, None]]], html: str):
+        self.options = options
+        self.blocks = blocks
+        self.html = html
+
+    def __str__(self):
+        return self.html
+
+    def __html__(self):
+        return self.html
+
+    def serialize(self) -> dict:
+        return {
+            "options": self.options,
+            "blocks": [list(block) for block in self.blocks],
+            "html": str(self.html),
+        }
+
+    @classmethod
+    def deserialize(cls, data: dict) -> "RenderedDocument":
+        return cls(
+            data["options"],
+            [tuple(block) for block in data["blocks"]],
+            mark_safe(data["html"]),
+        )
+
+
+def render_editorjs_incremental(
+        features: list[str],
+        data: dict,
+        previous: RenderedDocument = None,
+        context=None,
+        clean: bool = None,
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+    ) -> RenderedDocument:
+    """
+        Renders the editorjs value; re-using the HTML of blocks in a previous render.
+        Blocks are matched by their ID and a hash of their data (and tunes);
+        only blocks which were added or changed are rendered, passed to the inlines and sanitized.
+        The previous render is ignored entirely if it was rendered with other features or options.
+        The HTML is the same as that of `render_editorjs_html`.
+    """
+    blocks = data.get("blocks", [])
+    options = get_options_hash(
+        features, context, clean, whitelist_tags, whitelist_attrs,
+    )
+
+    reusable = {}
+    if previous is not None and previous.options == options:
+        reusable = {
+            (block_id, block_hash): html
+            for block_id, block_hash, html in previous.blocks
+        }
+
+    hashes = [hash_data(block) for block in blocks]
+    fragments = [
+        reusable.get((block.get("id"), block_hash), _MISSING)
+        for block, block_hash in zip(blocks, hashes)
+    ]
+
+    changed = [
+        i for i, fragment in enumerate(fragments)
+        if fragment is _MISSING
+    ]
+    if changed:
+        feature_mappings, inlines = _get_render_features(features)
+        policy = _get_render_policy(
+            features, clean, whitelist_tags, whitelist_attrs,
+        )
+        with instrument_render(context):
+            rendered = _render_fragments(
+                feature_mappings, inlines, [blocks[i] for i in changed], policy, context,
+            )
+        for i, fragment in zip(changed, rendered):
+            fragments[i] = fragment
+
+    html = wrap_html("\n".join([
+        fragment for fragment in fragments
+        if fragment is not None
+    ]), context)
+
+    return RenderedDocument(
+        options,
+        [
+            (block.get("id"), block_hash, fragment)
+            for block, block_hash, fragment in zip(blocks, hashes, fragments)
+        ],
+        html,
+    )
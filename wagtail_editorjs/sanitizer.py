@@ -0,0 +1,416 @@
+"""
+    Sanitization of rendered EditorJS HTML.
+    The allowed tags and attributes for a set of features are compiled
+    into a policy once, and re-used for every render with those features.
+"""
+
+from typing import Iterable, Iterator, Union
+from collections import defaultdict
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+from bs4.builder import HTMLTreeBuilder
+from bs4.dammit import EntitySubstitution
+from bs4.formatter import HTMLFormatter
+from . import settings
+from .registry import EDITOR_JS_FEATURES
+
+import threading
+import bleach
+import bs4
+import re
+
+
+DEFAULT_ALLOWED_TAGS = frozenset({
+    # Default inline tags.
+    "i", "b", "strong", "em", "u", "s", "strike"
+})
+
+ALLOWED_PROTOCOLS = frozenset(bleach.sanitizer.ALLOWED_PROTOCOLS)
+
+URI_ATTRIBUTES = frozenset(
+    name for _, name in bleach.html5lib_shim.attr_val_is_uri
+)
+
+VOID_ELEMENTS = frozenset(HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS)
+
+STRIPPED_STRINGS = (
+    bs4.Comment,
+    bs4.Declaration,
+    bs4.Doctype,
+    bs4.ProcessingInstruction,
+    bs4.CData,
+)
+
+
+class NullSanitizer:
+    @staticmethod
+    def sanitize_css(val):
+        return val
+
+
+class BaseSanitizer:
+    """
+        Base class for sanitizer backends.
+        A sanitizer removes anything not allowed by it's policy from the HTML.
+        One sanitizer is created for each policy and re-used between renders.
+    """
+    def __init__(self, policy: "SanitizerPolicy"):
+        self.policy = policy
+
+    def clean(self, html: str) -> str:
+        raise NotImplementedError("Subclasses must implement the clean method")
+
+    def clean_iter(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+            Sanitizes HTML which is passed in as multiple chunks.
+            Chunks do not need to be split on tag boundaries.
+            Backends which can sanitize a token stream yield output as they go;
+            by default the chunks are joined and cleaned at once.
+        """
+        yield self.clean("".join(chunks))
+
+
+class BleachSanitizer(BaseSanitizer):
+    """
+        Sanitizes HTML using bleach.
+    """
+    def __init__(self, policy: "SanitizerPolicy"):
+        super().__init__(policy)
+        self._local = threading.local()
+
+    @property
+    def cleaner(self) -> bleach.sanitizer.Cleaner:
+        """
+            Returns the bleach cleaner for the policy.
+            Cleaners are not thread-safe; a cleaner is kept for each thread.
+        """
+        cleaner = getattr(self._local, "cleaner", None)
+        if cleaner is None:
+            cleaner = bleach.sanitizer.Cleaner(
+                tags=self.policy.tags,
+                attributes=self.policy.attributes,
+                protocols=self.policy.protocols,
+                css_sanitizer=NullSanitizer,
+            )
+            self._local.cleaner = cleaner
+        return cleaner
+
+    def clean(self, html: str) -> str:
+        return self.cleaner.clean(html)
+
+
+class _OrderedAttributesFormatter(HTMLFormatter):
+    """
+        Keeps attributes in their original order and does not self-close void elements.
+        This mirrors the output of bleach as close as possible.
+    """
+    def attributes(self, tag: bs4.Tag):
+        if tag.attrs is None:
+            return []
+        return list(tag.attrs.items())
+
+
+def _substitute_entities(value: str) -> str:
+    return EntitySubstitution.substitute_xml(value).replace("\xa0", "&nbsp;")
+
+
+class SoupSanitizer(BaseSanitizer):
+    """
+        Sanitizes HTML using BeautifulSoup and the builtin `html.parser`.
+        Follows the same rules as the bleach sanitizer; disallowed tags are escaped,
+        disallowed attributes and URLs with disallowed protocols are removed
+        and comments are stripped.
+    """
+    formatter = _OrderedAttributesFormatter(
+        entity_substitution=_substitute_entities,
+        void_element_close_prefix=None,
+    )
+
+    def clean(self, html: str) -> str:
+        soup = bs4.BeautifulSoup(html, "html.parser", multi_valued_attributes=None)
+
+        for node in soup.find_all(string=_is_stripped_string):
+            node.extract()
+
+        tags = self.policy.tags
+        for tag in soup.find_all(True):
+            if tag.name not in tags:
+                self.escape_tag(tag)
+                continue
+
+            tag.attrs = dict(self.clean_attributes(tag.name, tag.attrs))
+
+        return soup.decode(formatter=self.formatter)
+
+    @cached_property
+    def allowed_attributes(self) -> dict[str, dict[str, str]]:
+        """
+            Maps the lowercased allowed attributes to their name in the policy.
+            The parser lowercases all attribute names; this restores names like `viewBox`.
+        """
+        return {
+            tag: {name.lower(): name for name in names}
+            for tag, names in self.policy.attributes.items()
+        }
+
+    def clean_attributes(self, tag: str, attrs: dict[str, str]) -> Iterator[tuple[str, str]]:
+        """
+            Yields the allowed attributes of an allowed tag; with their name as in the policy.
+        """
+        allowed = self.allowed_attributes.get(tag, {})
+        allowed_for_all = self.allowed_attributes.get("*", {})
+        for name, value in attrs.items():
+            allowed_name = allowed.get(name) or allowed_for_all.get(name)
+            if allowed_name is None:
+                continue
+
+            if name in URI_ATTRIBUTES and not self.is_allowed_uri(value):
+                continue
+
+            yield allowed_name, value
+
+    def escape_tag(self, tag: bs4.Tag):
+        """
+            Replace the tag with it's escaped start- and end tag.
+            The children of the tag are kept (and sanitized).
+        """
+        attrs = "".join([
+            f' {name}="{value}"'
+            for name, value in tag.attrs.items()
+        ])
+        tag.insert_before(bs4.NavigableString(f"<{tag.name}{attrs}>"))
+        if not tag.is_empty_element:
+            tag.insert_after(bs4.NavigableString(f"</{tag.name}>"))
+        tag.unwrap()
+
+    def is_allowed_uri(self, value: str) -> bool:
+        """
+            Checks the protocol of an URI value; the same way bleach does.
+        """
+        normalized = re.sub(r"[`\000-\040\177-\240\s]+", "", value)
+        normalized = re.sub(r"[^\x00-\x7f]", "", normalized).lower()
+        try:
+            parsed = urlparse(normalized)
+        except ValueError:
+            return False
+
+        protocols = self.policy.protocols
+        if parsed.scheme:
+            return parsed.scheme in protocols
+
+        if normalized.startswith("#"):
+            return True
+
+        if ":" in normalized and normalized.split(":")[0] in protocols:
+            return True
+
+        return "http" in protocols or "https" in protocols
+
+
+class _SanitizingParser(HTMLParser):
+    """
+        Writes the sanitized tokens of the fed HTML to `output`.
+        Open tags are tracked the same way BeautifulSoup does;
+        stray end tags are dropped and unclosed tags are closed at the end.
+    """
+    def __init__(self, sanitizer: "StreamSanitizer"):
+        super().__init__(convert_charrefs=True)
+        self.sanitizer = sanitizer
+        self.tags = sanitizer.policy.tags
+        self.open_tags = []
+        self.output = []
+
+    def handle_starttag(self, tag, attrs):
+        self.start_tag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.start_tag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.end_tag(tag)
+
+    def handle_endtag(self, tag):
+        if tag not in self.open_tags:
+            return
+
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.end_tag(open_tag)
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        self.output.append(_substitute_entities(data))
+
+    def start_tag(self, tag, attrs):
+        # Duplicate attributes keep their first position and last value.
+        attrs = dict((name, value or "") for name, value in attrs)
+        if tag not in self.tags:
+            escaped = "".join([
+                f' {name}="{value}"'
+                for name, value in attrs.items()
+            ])
+            self.output.append(_substitute_entities(f"<{tag}{escaped}>"))
+            return
+
+        self.output.append(f"<{tag}")
+        for name, value in self.sanitizer.clean_attributes(tag, attrs):
+            self.output.append(f" {name}={_quote_attribute(value)}")
+        self.output.append(">")
+
+    def end_tag(self, tag):
+        if tag in self.tags:
+            self.output.append(f"</{tag}>")
+        else:
+            self.output.append(_substitute_entities(f"</{tag}>"))
+
+    def close(self):
+        super().close()
+        while self.open_tags:
+            self.end_tag(self.open_tags.pop())
+
+
+def _quote_attribute(value: str) -> str:
+    # Quote the same way BeautifulSoup does.
+    value = _substitute_entities(value)
+    if '"' not in value:
+        return f'"{value}"'
+
+    if "'" not in value:
+        return f"'{value}'"
+
+    return '"{}"'.format(value.replace('"', "&quot;"))
+
+
+class StreamSanitizer(SoupSanitizer):
+    """
+        Sanitizes HTML as a stream of tokens using the builtin `html.parser`.
+        Follows the same rules as the soup sanitizer, but never builds a tree;
+        the HTML can be fed in chunks and sanitized output is produced as the chunks are parsed.
+    """
+    def clean(self, html: str) -> str:
+        return "".join(self.clean_iter([html]))
+
+    def clean_iter(self, chunks: Iterable[str]) -> Iterator[str]:
+        parser = _SanitizingParser(self)
+        for chunk in chunks:
+            parser.feed(chunk)
+            if parser.output:
+                yield "".join(parser.output)
+                parser.output.clear()
+
+        parser.close()
+        if parser.output:
+            yield "".join(parser.output)
+
+
+def _is_stripped_string(node) -> bool:
+    return isinstance(node, STRIPPED_STRINGS)
+
+
+class SanitizerPolicy:
+    """
+        The compiled set of allowed tags and attributes for a set of features.
+    """
+    def __init__(self, tags: frozenset[str], attributes: dict[str, frozenset[str]], protocols: frozenset[str] = ALLOWED_PROTOCOLS):
+        self.tags = tags
+        self.attributes = attributes
+        self.protocols = protocols
+
+    def __repr__(self):
+        return f"<SanitizerPolicy tags={sorted(self.tags)}>"
+
+    @cached_property
+    def sanitizer(self) -> BaseSanitizer:
+        """
+            Returns the configured sanitizer backend for this policy.
+        """
+        return get_sanitizer_class()(self)
+
+    def clean(self, html: str) -> str:
+        return self.sanitizer.clean(html)
+
+    def clean_iter(self, chunks: Iterable[str]) -> Iterator[str]:
+        return self.sanitizer.clean_iter(chunks)
+
+
+def get_sanitizer_class(path: str = None) -> type[BaseSanitizer]:
+    return import_string(path or settings.SANITIZER)
+
+
+def compile_policy(
+        features: list[str],
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+    ) -> SanitizerPolicy:
+    """
+        Builds the allowed tags and attributes for the given features.
+    """
+    allowed_tags = set(DEFAULT_ALLOWED_TAGS)
+    allowed_attributes = defaultdict(set)
+
+    for feature in features:
+        feature = EDITOR_JS_FEATURES[feature]
+        allowed_tags.update(feature.allowed_tags)
+
+        for key, value in feature.allowed_attributes.items():
+            allowed_attributes[key].update(value)
+
+    if whitelist_tags:
+        allowed_tags.update(whitelist_tags)
+
+    allowed_attributes["*"].add(settings.BLOCK_ID_ATTR)
+
+    if whitelist_attrs:
+        if isinstance(whitelist_attrs, dict):
+            for key, value in whitelist_attrs.items():
+                allowed_attributes[key].update(value)
+        else:
+            for key in allowed_attributes:
+                allowed_attributes[key].update(whitelist_attrs)
+
+    return SanitizerPolicy(
+        frozenset(allowed_tags),
+        {
+            key: frozenset(value)
+            for key, value in allowed_attributes.items()
+        },
+    )
+
+
+_policies: dict[tuple, SanitizerPolicy] = {}
+
+
+def get_policy(
+        features: list[str],
+        whitelist_tags: list[str] = None,
+        whitelist_attrs: Union[dict, list] = None,
+    ) -> SanitizerPolicy:
+    """
+        Returns the (memoized) sanitizer policy for the given features and whitelists.
+        Policies are re-compiled when any of the features are re-registered or reconfigured.
+    """
+    if isinstance(whitelist_attrs, dict):
+        attrs_key = frozenset(
+            (key, frozenset(value))
+            for key, value in whitelist_attrs.items()
+        )
+    else:
+        attrs_key = frozenset(whitelist_attrs or [])
+
+    features = tuple(features)
+    key = (
+        EDITOR_JS_FEATURES.fingerprint(features),
+        features,
+        frozenset(whitelist_tags or []),
+        attrs_key,
+    )
+
+    policy = _policies.get(key)
+    if policy is None:
+        policy = compile_policy(features, whitelist_tags, whitelist_attrs)
+        _policies[key] = policy
+    return policy
@@ -1,4 +1,5 @@
 from django.conf import settings as django_settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
 
 """
@@ -28,3 +29,50 @@ Use full urls if the request
 is available in the EditorJS rendering context.
 """
 USE_FULL_URLS = getattr(django_settings, 'EDITORJS_USE_FULL_URLS', False)
+
+"""
+The alias of the Django cache used to store rendered EditorJS documents.
+Rendering is not cached if this is None.
+
+Optionally; caching can be FORCED by passing `cache=True` or `False` to the `render_editorjs_html` function.
+"""
+RENDER_CACHE = getattr(django_settings, 'EDITORJS_RENDER_CACHE', None)
+
+"""
+The timeout in seconds for rendered documents and blocks in the render and block caches.
+Defaults to the timeout configured for the cache itself.
+"""
+RENDER_CACHE_TIMEOUT = getattr(django_settings, 'EDITORJS_RENDER_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+
+"""
+The alias of the Django cache used to store the rendered HTML of individual blocks.
+Only blocks which changed are rendered again; blocks are not cached if this is None.
+Uses `RENDER_CACHE_TIMEOUT` as the timeout.
+
+Optionally; block caching can be FORCED by passing `block_cache=True` or `False` to the `render_editorjs_html` function.
+"""
+BLOCK_CACHE = getattr(django_settings, 'EDITORJS_BLOCK_CACHE', None)
+
+"""
+The BeautifulSoup parser used to parse rendered HTML for inlines and `EditorJSSoupElement`.
+`lxml` is a lot faster than the builtin `html.parser`, but must be installed separately.
+"""
+HTML_PARSER = getattr(django_settings, 'EDITORJS_HTML_PARSER', 'html.parser')
+
+"""
+The amount of processes used by `wagtail_editorjs.bulk.bulk_render`.
+Defaults to the amount of CPUs; 0 renders in the calling process.
+"""
+BULK_RENDER_WORKERS = getattr(django_settings, 'EDITORJS_BULK_RENDER_WORKERS', None)
+
+"""
+The amount of documents read from the database and rendered at once by `bulk_render`.
+"""
+BULK_RENDER_CHUNK_SIZE = getattr(django_settings, 'EDITORJS_BULK_RENDER_CHUNK_SIZE', 100)
+
+"""
+The sanitizer backend used to clean the HTML.
+Builtin backends are `BleachSanitizer`, `SoupSanitizer` and `StreamSanitizer`;
+the latter two are built on BeautifulSoup and `html.parser` and are a lot faster.
+"""
+SANITIZER = getattr(django_settings, 'EDITORJS_SANITIZER', 'wagtail_editorjs.sanitizer.BleachSanitizer')
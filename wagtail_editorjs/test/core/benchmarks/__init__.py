@@ -0,0 +1,44 @@
+"""
+    Benchmarks for the rendering pipeline.
+    These are not discovered by the default test run; run them by module:
+
+        python wagtail_editorjs/test/manage.py test wagtail_editorjs.test.core.benchmarks.bench_sanitizers
+        python wagtail_editorjs/test/manage.py test wagtail_editorjs.test.core.benchmarks.bench_render
+        python wagtail_editorjs/test/manage.py test wagtail_editorjs.test.core.benchmarks.bench_elements
+        python wagtail_editorjs/test/manage.py test wagtail_editorjs.test.core.benchmarks.bench_serialize
+
+    Set `EDITORJS_BENCHMARK_OUTPUT` to a file path to write the results as JSON.
+    `EDITORJS_BENCHMARK_ITERATIONS` and `EDITORJS_BENCHMARK_SIZES` (for `bench_render`) tune how much work is done.
+"""
+import json
+import os
+
+
+def get_iterations(default: int = 20) -> int:
+    return int(os.environ.get("EDITORJS_BENCHMARK_ITERATIONS", default))
+
+
+def write_results(name: str, results: list[dict]):
+    """
+        Prints the results and writes them to `EDITORJS_BENCHMARK_OUTPUT` (if set).
+        Each benchmark module is stored under it's own name in the output file.
+    """
+    print(f"\n{name}")
+    for result in results:
+        print("    " + ", ".join([
+            f"{key}={value:.6g}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in result.items()
+        ]))
+
+    path = os.environ.get("EDITORJS_BENCHMARK_OUTPUT")
+    if not path:
+        return
+
+    output = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            output = json.load(f)
+
+    output[name] = results
+    with open(path, "w") as f:
+        json.dump(output, f, indent=4)
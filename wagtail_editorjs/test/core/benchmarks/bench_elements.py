@@ -0,0 +1,119 @@
+import gc
+import time
+import tracemalloc
+
+from django.test import SimpleTestCase
+
+from wagtail_editorjs.registry import EditorJSElement
+from wagtail_editorjs.registry.element.attrs import EditorJSElementAttribute
+from . import get_iterations, write_results
+
+
+class DictElement(EditorJSElement):
+    """
+        An element with an instance `__dict__`; as all elements were before they were slotted.
+    """
+
+
+class SetAttribute(EditorJSElementAttribute):
+    """
+        An attribute with an instance `__dict__` which always stores it's value in a set;
+        as all attributes did before they were slotted.
+    """
+    def __init__(self, value, delimiter: str = " "):
+        if not isinstance(value, (list, tuple, set)):
+            value = [value]
+
+        self._value = set(value)
+        self.delimiter = delimiter
+
+    @property
+    def value(self) -> set:
+        return self._value
+
+    def extend(self, value):
+        if isinstance(value, (tuple, list, set)):
+            self._value.update(value)
+        else:
+            self._value.add(value)
+
+    def __str__(self):
+        return self.delimiter.join([str(item) for item in self._value])
+
+
+def build_table(element_class: type[EditorJSElement], attribute_class: type[EditorJSElementAttribute], rows: int, columns: int) -> EditorJSElement:
+    """
+        Builds a table the way the table feature does; every cell has a class.
+    """
+    tbody = element_class("tbody")
+    for row in range(rows):
+        tbody.append(element_class(
+            "tr",
+            [
+                element_class("td", f"Cell {row}:{column}", attrs={
+                    "class": attribute_class("table-cell"),
+                })
+                for column in range(columns)
+            ],
+        ))
+    return element_class("table", [tbody])
+
+
+class BenchmarkElements(SimpleTestCase):
+    """
+        Measures the memory, allocations and time to build and render
+        a table of 10.000 cells with slotted elements and attributes,
+        compared to elements with an instance `__dict__` and set-valued attributes.
+    """
+    rows = 100
+    columns = 100
+
+    def measure(self, element_class, attribute_class) -> dict:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            table = build_table(element_class, attribute_class, self.rows, self.columns)
+            snapshot = tracemalloc.take_snapshot()
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        allocations = sum(stat.count for stat in snapshot.statistics("filename"))
+        html = str(table)
+        del table
+
+        iterations = get_iterations()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            str(build_table(element_class, attribute_class, self.rows, self.columns))
+        elapsed = time.perf_counter() - start
+
+        return {
+            "cells": self.rows * self.columns,
+            "retained_bytes": retained,
+            "peak_bytes": peak,
+            "allocations": allocations,
+            "seconds_per_table": elapsed / iterations,
+            "output_bytes": len(html),
+        }, html
+
+    def test_elements(self):
+        slotted, slotted_html = self.measure(EditorJSElement, EditorJSElementAttribute)
+        legacy, legacy_html = self.measure(DictElement, SetAttribute)
+
+        self.assertEqual(slotted_html, legacy_html)
+
+        results = [
+            {"elements": "slotted", **slotted},
+            {"elements": "dict", **legacy},
+            {
+                "elements": "saved",
+                "retained_bytes": legacy["retained_bytes"] - slotted["retained_bytes"],
+                "retained_ratio": slotted["retained_bytes"] / legacy["retained_bytes"],
+                "allocations": legacy["allocations"] - slotted["allocations"],
+                "allocation_ratio": slotted["allocations"] / legacy["allocations"],
+            },
+        ]
+        write_results("elements", results)
+
+        self.assertLess(slotted["retained_bytes"], legacy["retained_bytes"])
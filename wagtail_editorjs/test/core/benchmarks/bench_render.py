@@ -0,0 +1,155 @@
+import copy
+import os
+import time
+import tracemalloc
+
+from ..tests.base import BaseEditorJSTest, get_test_blocks
+from wagtail_editorjs.render import render_editorjs_html
+from wagtail_editorjs.registry import (
+    EditorJSFeature,
+    InlineEditorJSFeature,
+    EditorJSTune,
+    EDITOR_JS_FEATURES,
+)
+from . import get_iterations, write_results
+
+
+TUNES = {
+    "text-alignment-tune": {"alignment": "center"},
+    "text-variant-tune": "call-out",
+    "background-color-tune": {"color": "#ff0000", "stretched": True},
+    "text-color-tune": {"color": "#00ff00"},
+}
+
+
+def get_sizes() -> list[int]:
+    sizes = os.environ.get("EDITORJS_BENCHMARK_SIZES", "10,100,1000,10000")
+    return [int(size) for size in sizes.split(",")]
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """
+        Nearest-rank percentile of the samples.
+    """
+    samples = sorted(samples)
+    index = max(0, min(len(samples) - 1, round(percent / 100 * len(samples) + 0.5) - 1))
+    return samples[index]
+
+
+def build_document(blocks: list[dict], size: int) -> dict:
+    """
+        Repeats the blocks until the document has `size` blocks.
+    """
+    return {
+        "blocks": [
+            dict(blocks[i % len(blocks)], id=f"benchmark_{i}")
+            for i in range(size)
+        ],
+    }
+
+
+class BenchmarkRender(BaseEditorJSTest):
+    """
+        Measures the render pipeline and the registry on synthetic documents
+        built from the test data of every registered feature.
+        Reports throughput, p50/p99 latency and peak memory per operation, document mix and size.
+
+        Sizes can be set with `EDITORJS_BENCHMARK_SIZES` (comma separated).
+    """
+
+    def get_mixes(self) -> dict[str, tuple[list[str], list[dict]]]:
+        block_features = [
+            name for name, feature in EDITOR_JS_FEATURES.features.items()
+            if isinstance(feature, EditorJSFeature)
+        ]
+        inline_features = [
+            name for name, feature in EDITOR_JS_FEATURES.features.items()
+            if isinstance(feature, InlineEditorJSFeature)
+        ]
+        tune_features = [
+            name for name, feature in EDITOR_JS_FEATURES.features.items()
+            if isinstance(feature, EditorJSTune) and name in TUNES
+        ]
+        tunes = {
+            name: TUNES[name]
+            for name in tune_features
+        }
+
+        return {
+            "blocks": (block_features, get_test_blocks(block_features)),
+            "tunes": (block_features + tune_features, get_test_blocks(block_features, tunes=tunes)),
+            "inlines": (block_features + inline_features, get_test_blocks(block_features + inline_features)),
+            "all": (block_features + inline_features + tune_features, get_test_blocks(block_features + inline_features, tunes=tunes)),
+        }
+
+    def measure(self, func, make_args, iterations: int) -> dict:
+        # Warm up; fills any lookup tables and memoized policies.
+        func(*make_args())
+
+        samples = []
+        for _ in range(iterations):
+            args = make_args()
+            start = time.perf_counter()
+            func(*args)
+            samples.append(time.perf_counter() - start)
+
+        args = make_args()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "iterations": iterations,
+            "mean_seconds": sum(samples) / len(samples),
+            "p50_seconds": percentile(samples, 50),
+            "p99_seconds": percentile(samples, 99),
+            "peak_memory_bytes": peak,
+        }
+
+    def test_render(self):
+        results = []
+        for mix, (features, blocks) in self.get_mixes().items():
+            for size in get_sizes():
+                document = build_document(blocks, size)
+                # Documents are mutated by the registry; give every call it's own copy.
+                make_document = lambda: (features, copy.deepcopy(document))
+                iterations = max(3, get_iterations() * 100 // size)
+
+                operations = {
+                    "render_editorjs_html": lambda features, data: render_editorjs_html(
+                        features, data, cache=False, block_cache=False,
+                    ),
+                    "to_python": EDITOR_JS_FEATURES.to_python,
+                    "validate_for_tools": EDITOR_JS_FEATURES.validate_for_tools,
+                    "prepare_value": EDITOR_JS_FEATURES.prepare_value,
+                }
+
+                for operation, func in operations.items():
+                    result = self.measure(func, make_document, iterations)
+                    results.append({
+                        "operation": operation,
+                        "mix": mix,
+                        "blocks": size,
+                        "blocks_per_second": size / result["mean_seconds"],
+                        **result,
+                    })
+
+            # The configuration does not depend on the document.
+            context = {"widget": {"attrs": {"id": "benchmark"}}}
+            result = self.measure(
+                EDITOR_JS_FEATURES.build_config,
+                lambda: (features, context),
+                get_iterations(),
+            )
+            results.append({
+                "operation": "build_config",
+                "mix": mix,
+                "blocks": 0,
+                "blocks_per_second": None,
+                **result,
+            })
+
+        write_results("render", results)
@@ -0,0 +1,73 @@
+from django.test.html import parse_html
+import time
+
+from ..tests.base import BaseEditorJSTest, get_test_blocks
+from wagtail_editorjs.render import render_editorjs_html
+from wagtail_editorjs.sanitizer import (
+    BleachSanitizer,
+    SoupSanitizer,
+    StreamSanitizer,
+    get_policy,
+)
+from wagtail_editorjs.registry import EDITOR_JS_FEATURES
+from . import get_iterations, write_results
+
+
+SANITIZERS = [
+    BleachSanitizer,
+    SoupSanitizer,
+    StreamSanitizer,
+]
+
+
+class BenchmarkSanitizers(BaseEditorJSTest):
+    """
+        Compares the throughput and output of the sanitizer backends
+        on the test data of every registered feature.
+    """
+
+    def test_sanitizers(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        policy = get_policy(features)
+        html = render_editorjs_html(
+            features,
+            {"blocks": get_test_blocks(features)},
+            clean=False,
+        )
+        iterations = get_iterations()
+
+        results = []
+        outputs = {}
+        for sanitizer_class in SANITIZERS:
+            sanitizer = sanitizer_class(policy)
+
+            # Warm up; the first run compiles regexes and populates lookup tables.
+            outputs[sanitizer_class] = sanitizer.clean(html)
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                sanitizer.clean(html)
+            elapsed = time.perf_counter() - start
+
+            results.append({
+                "sanitizer": sanitizer_class.__name__,
+                "iterations": iterations,
+                "input_bytes": len(html.encode("utf-8")),
+                "seconds_per_document": elapsed / iterations,
+                "documents_per_second": iterations / elapsed,
+                "megabytes_per_second": len(html.encode("utf-8")) * iterations / elapsed / 1024 / 1024,
+            })
+
+        reference = outputs[BleachSanitizer]
+        for result, sanitizer_class in zip(results, SANITIZERS):
+            output = outputs[sanitizer_class]
+            result["identical_output"] = output == reference
+            result["equivalent_output"] = parse_html(output) == parse_html(reference)
+
+        write_results("sanitizers", results)
+
+        for result in results:
+            self.assertTrue(
+                result["equivalent_output"],
+                msg=f"{result['sanitizer']} output is not equivalent to the output of bleach",
+            )
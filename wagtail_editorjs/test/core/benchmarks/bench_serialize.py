@@ -0,0 +1,66 @@
+import pickle
+import time
+
+from ..tests.base import BaseEditorJSTest, get_test_blocks
+from wagtail_editorjs.registry import (
+    EditorJSFeature,
+    EDITOR_JS_FEATURES,
+    dump_element,
+    load_element,
+)
+from . import get_iterations, write_results
+
+
+class BenchmarkSerialize(BaseEditorJSTest):
+    """
+        Measures loading serialized element trees against rendering the blocks again,
+        for the test data of every registered block feature.
+        Pickle is measured as well, for reference.
+    """
+
+    def measure(self, func, items: list) -> float:
+        iterations = get_iterations(200)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for item in items:
+                func(item)
+        return (time.perf_counter() - start) / iterations
+
+    def test_serialize(self):
+        blocks = [
+            block for block in get_test_blocks()
+            if isinstance(EDITOR_JS_FEATURES[block["type"]], EditorJSFeature)
+        ]
+        features = [
+            EDITOR_JS_FEATURES[block["type"]]
+            for block in blocks
+        ]
+        elements = [
+            feature.render_block_data(block)
+            for feature, block in zip(features, blocks)
+        ]
+
+        dumped = [dump_element(element) for element in elements]
+        pickled = [pickle.dumps(element) for element in elements]
+
+        for element, data in zip(elements, dumped):
+            self.assertEqual(str(load_element(data)), str(element))
+
+        render = self.measure(lambda item: item[0].render_block_data(item[1]), list(zip(features, blocks)))
+        load = self.measure(load_element, dumped)
+        unpickle = self.measure(pickle.loads, pickled)
+
+        results = [
+            {"method": "render_block_data", "blocks": len(blocks), "seconds": render},
+            {
+                "method": "load_element", "blocks": len(blocks), "seconds": load,
+                "bytes": sum(len(data) for data in dumped), "speedup": render / load,
+            },
+            {
+                "method": "pickle", "blocks": len(blocks), "seconds": unpickle,
+                "bytes": sum(len(data) for data in pickled), "speedup": render / unpickle,
+            },
+        ]
+        write_results("serialize", results)
+
+        self.assertLess(load, render)
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:00
+
+import wagtail_editorjs.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EditorJSTestModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content', wagtail_editorjs.fields.EditorJSField(blank=True, features=['attaches', 'header', 'image', 'images', 'link', 'paragraph', 'tooltip', 'text-alignment-tune'], null=True, tools_config={})),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:01
+
+import wagtail.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EditorJSStreamTestModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('body', wagtail.fields.StreamField([('editorjs', 0), ('section', 3), ('columns', 4), ('text', 1)], blank=True, block_lookup={0: ('wagtail_editorjs.blocks.EditorJSBlock', (), {'features': ['header', 'paragraph', 'image', 'link']}), 1: ('wagtail.blocks.CharBlock', (), {}), 2: ('wagtail_editorjs.blocks.EditorJSBlock', (), {'features': ['paragraph', 'link']}), 3: ('wagtail.blocks.StructBlock', [[('title', 1), ('content', 2)]], {}), 4: ('wagtail.blocks.ListBlock', (2,), {})})),
+            ],
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:11
+
+import wagtail_editorjs.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_stream_test_model'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EditorJSRenderedTestModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content', wagtail_editorjs.fields.EditorJSField(blank=True, features=['header', 'image', 'link', 'paragraph'], null=True, rendered_field='content_html', tools_config={})),
+                ('content_html', models.TextField(blank=True, default='')),
+            ],
+        ),
+    ]
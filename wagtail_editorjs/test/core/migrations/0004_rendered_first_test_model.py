@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:57
+
+import wagtail_editorjs.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_rendered_test_model'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EditorJSRenderedFirstTestModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_html', models.TextField(blank=True, default='')),
+                ('content', wagtail_editorjs.fields.EditorJSField(blank=True, features=['header', 'link', 'paragraph'], null=True, rendered_field='content_html', tools_config={})),
+            ],
+        ),
+    ]
@@ -0,0 +1,64 @@
+from django.db import models
+from wagtail import blocks
+from wagtail.fields import StreamField
+from wagtail_editorjs.blocks import EditorJSBlock
+from wagtail_editorjs.fields import EditorJSField
+
+
+class EditorJSTestModel(models.Model):
+    content = EditorJSField(
+        features=[
+            "attaches",
+            "header",
+            "image",
+            "images",
+            "link",
+            "paragraph",
+            "tooltip",
+            "text-alignment-tune",
+        ],
+        blank=True,
+        null=True,
+    )
+
+
+class EditorJSStreamTestModel(models.Model):
+    body = StreamField([
+        ("editorjs", EditorJSBlock(features=["header", "paragraph", "image", "link"])),
+        ("section", blocks.StructBlock([
+            ("title", blocks.CharBlock()),
+            ("content", EditorJSBlock(features=["paragraph", "link"])),
+        ])),
+        ("columns", blocks.ListBlock(EditorJSBlock(features=["paragraph", "link"]))),
+        ("text", blocks.CharBlock()),
+    ], blank=True)
+
+
+class EditorJSRenderedTestModel(models.Model):
+    content = EditorJSField(
+        features=[
+            "header",
+            "image",
+            "link",
+            "paragraph",
+        ],
+        rendered_field="content_html",
+        blank=True,
+        null=True,
+    )
+    content_html = models.TextField(blank=True, default="")
+
+
+class EditorJSRenderedFirstTestModel(models.Model):
+    # The rendered field is declared (and thus read when saving) before the EditorJSField.
+    content_html = models.TextField(blank=True, default="")
+    content = EditorJSField(
+        features=[
+            "header",
+            "link",
+            "paragraph",
+        ],
+        rendered_field="content_html",
+        blank=True,
+        null=True,
+    )
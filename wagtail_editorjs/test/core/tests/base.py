@@ -9,6 +9,11 @@ from wagtail.images.tests.utils import (
 from wagtail.images import get_image_model
 from wagtail.documents import get_document_model
 from wagtail_editorjs import settings
+from wagtail_editorjs.registry import (
+    EditorJSFeature,
+    InlineEditorJSFeature,
+    EDITOR_JS_FEATURES,
+)
 
 
 Image = get_image_model()
@@ -67,3 +72,37 @@ class BaseEditorJSTest(TestCase):
         # call_command("fixtree")
         # call_command("set_url_paths")
 
+
+def get_test_blocks(features: list[str] = None, tunes: dict = None) -> list[dict]:
+    """
+        Builds a list of blocks from the test data of every (given) block feature.
+        Inline test data is added as paragraphs.
+    """
+    blocks = []
+    if features is None:
+        features = EDITOR_JS_FEATURES.keys()
+
+    for i, name in enumerate(features):
+        feature = EDITOR_JS_FEATURES[name]
+        test_data = feature.get_test_data()
+        if not test_data:
+            continue
+
+        for j, data in enumerate(test_data):
+            if isinstance(feature, InlineEditorJSFeature):
+                initial, _ = data
+                name, data = "paragraph", {"text": f"Inline {initial} data"}
+            elif not isinstance(feature, EditorJSFeature):
+                continue
+
+            block = {
+                "id": f"test_id_{i}_{j}",
+                "type": name,
+                "data": data,
+            }
+            if tunes:
+                block["tunes"] = tunes
+
+            blocks.append(block)
+
+    return blocks
@@ -1,4 +1,5 @@
 from django.test import TestCase
+from wagtail_editorjs.features.lists import NestedListElement, parse_list
 from wagtail_editorjs.registry.element.element import EditorJSElement
 from wagtail_editorjs.registry.element.utils import (
     wrap_tag,
@@ -96,4 +97,112 @@ class TestEditorJSElement(TestCase):
             '<div id="test-id" class="test-class test-class-2" style="color: red;background-color: blue">Hello, World!</div>'
         )
 
-    
+    def test_compact_attribute(self):
+        attr = EditorJSElementAttribute("test-class")
+        self.assertFalse(hasattr(attr, "__dict__"))
+        self.assertFalse(hasattr(EditorJSElement("div"), "__dict__"))
+        self.assertEqual(attr._value, "test-class")
+        self.assertEqual(attr, ["test-class"])
+        self.assertEqual(attr, EditorJSElementAttribute(["test-class"]))
+
+        # Only promoted when extended.
+        attr.extend("test-class-2")
+        self.assertEqual(list(attr._value), ["test-class", "test-class-2"])
+        self.assertEqual(attr, ["test-class", "test-class-2"])
+        self.assertEqual(str(attr), "test-class test-class-2")
+
+    def test_attribute_order(self):
+        # Insertion order is kept and duplicates are removed.
+        attr = EditorJSElementAttribute(["b", "a", "b", "c"])
+        self.assertEqual(str(attr), "b a c")
+
+        attr.extend(["d", "a"])
+        attr.extend({"f", "e"})
+        attr.value.add("b")
+        self.assertEqual(str(attr), "b a c d e f")
+
+        # Sets are sorted.
+        self.assertEqual(str(EditorJSElementAttribute({"stretched", "with-border"})), "stretched with-border")
+
+    def test_write_nested(self):
+        # Deeper than the recursion limit; the tree is written without recursion.
+        element = EditorJSElement("span", "Deep")
+        for _ in range(5000):
+            element = EditorJSElement("div", [element, "Text"])
+
+        self.assertEqual(
+            str(element),
+            "<div>" * 5000 + "<span>Deep</span>" + "\nText</div>" * 5000,
+        )
+
+    def test_write_nested_list(self):
+        self.assertEqual(
+            str(parse_list([{"content": "Item", "items": [{"content": "Sub", "items": []}]}], "ul")),
+            '<ul class="nested-list" style="--depth: 0"><li>Item'
+            '<ul class="nested-list" style="--depth: 1"><li>Sub</li></ul>'
+            '</li></ul>',
+        )
+
+        element = NestedListElement("ul", ["<li>Deep</li>"])
+        for _ in range(5000):
+            element = NestedListElement("ul", ["<li>", element, "</li>"])
+
+        self.assertEqual(
+            str(element),
+            "<ul><li>" * 5000 + "<ul><li>Deep</li></ul>" + "</li></ul>" * 5000,
+        )
+
+    def test_write_subclasses(self):
+        class StrElement(EditorJSElement):
+            def __str__(self):
+                return "<custom-str></custom-str>"
+
+        class WriteElement(EditorJSElement):
+            def write(self, out: list[str]):
+                out.append("<custom-write>")
+                super().write(out)
+                out.append("</custom-write>")
+
+        class WriteStrElement(EditorJSElement):
+            def write(self, out: list[str]):
+                out.append("<custom-write>")
+                super().write(out)
+                out.append("</custom-write>")
+
+            def __str__(self):
+                return "<!--x-->" + super().__str__()
+
+        self.assertEqual(
+            str(WriteStrElement("p", "hi")),
+            "<!--x--><custom-write><p>hi</p></custom-write>",
+        )
+
+        element = EditorJSElement("div", [
+            StrElement("span"),
+            WriteElement("p", ["Text", EditorJSElement("b", "Bold")], attrs={"class": "test-class"}),
+        ])
+
+        expected = (
+            '<div><custom-str></custom-str>\n'
+            '<custom-write><p class="test-class">Text\n<b>Bold</b></p></custom-write></div>'
+        )
+        self.assertEqual(str(element), expected)
+        self.assertEqual(element.content, expected[len("<div>"):-len("</div>")])
+
+    def test_write_super_str(self):
+        class SuperStrElement(EditorJSElement):
+            def __str__(self):
+                return "<!--x-->" + super().__str__()
+
+        element = SuperStrElement("p", "hi")
+        self.assertEqual(str(element), "<!--x--><p>hi</p>")
+
+        out = []
+        element.write(out)
+        self.assertEqual("".join(out), "<!--x--><p>hi</p>")
+
+        self.assertEqual(
+            str(EditorJSElement("div", [element])),
+            "<div><!--x--><p>hi</p></div>",
+        )
+
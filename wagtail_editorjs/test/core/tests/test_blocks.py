@@ -2,6 +2,7 @@ from wagtail import blocks
 from django.template.loader import render_to_string
 from django.utils.safestring import mark_safe
 import time
+from unittest import mock
 
 from wagtail_editorjs.features import (
     WagtailBlockFeature,
@@ -9,6 +10,8 @@ from wagtail_editorjs.features import (
 from wagtail_editorjs.render import render_editorjs_html
 from wagtail_editorjs.registry import (
     EDITOR_JS_FEATURES,
+    EditorJSRawElement,
+    wrapper,
 )
 
 from .base import BaseEditorJSTest
@@ -162,3 +165,44 @@ class TestWagtailBlockFeature(BaseEditorJSTest):
             feature_html,
         )
 
+    def test_render_block_data_not_parsed(self):
+        feature_value = {
+            "type": "test_feature",
+            "data": {
+                "block": {
+                    "title": "Test Title",
+                    "subtitle": "Test Text",
+                    "sub_block": {
+                        "sub_title": "Sub Title",
+                        "sub_text": "Sub Text",
+                    },
+                },
+            }
+        }
+
+        with mock.patch("wagtail_editorjs.registry.element.element.parse_html") as parse_html:
+            element = self.feature.render_block_data(feature_value)
+            element.add_attributes(class_="tuned", style={"text-align": "center"})
+            html = str(element)
+
+        parse_html.assert_not_called()
+        self.assertIsInstance(element, EditorJSRawElement)
+        self.assertEqual(
+            html,
+            "<div class=\"test_feature tuned\" style=\"text-align: center\">"
+            f"{self.block.render(self.block.to_python(feature_value['data']['block']))}"
+            "</div>",
+        )
+
+    def test_raw_element(self):
+        element = EditorJSRawElement("div", "<p class='a'>Unclosed <b>tags", attrs={"class": "block"})
+        element.attrs["data-id"] = "test_id"
+        self.assertEqual(element.raw_html, "<p class='a'>Unclosed <b>tags")
+        self.assertEqual(
+            str(element),
+            "<div class=\"block\" data-id=\"test_id\"><p class='a'>Unclosed <b>tags</div>",
+        )
+        self.assertEqual(
+            str(wrapper(element, attrs={"class": "wrapper"})),
+            "<div class=\"wrapper\"><div class=\"block\" data-id=\"test_id\"><p class='a'>Unclosed <b>tags</div></div>",
+        )
@@ -0,0 +1,78 @@
+from unittest import skipUnless
+from django.test import TransactionTestCase
+import multiprocessing
+
+from .base import BaseEditorJSTest, get_test_blocks
+from ..models import EditorJSTestModel
+from wagtail_editorjs.bulk import bulk_render, iter_chunks
+from wagtail_editorjs.render import render_editorjs_queryset
+
+
+class TestBulkRender(BaseEditorJSTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        features = ["image", "attaches", "header", "paragraph", "link"]
+        for i in range(7):
+            blocks = get_test_blocks(features[:i % len(features) + 1])
+            EditorJSTestModel.objects.create(
+                content={"blocks": blocks} if i % 3 else None,
+            )
+
+        self.expected = {
+            obj.pk: str(html)
+            for obj, html in render_editorjs_queryset(EditorJSTestModel.objects.all(), "content", cache=False)
+        }
+
+    def test_iter_chunks(self):
+        chunks = list(iter_chunks(EditorJSTestModel.objects.all(), "content", 3))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        self.assertEqual(
+            [pk for chunk in chunks for pk, _ in chunk],
+            sorted(self.expected.keys()),
+        )
+
+        # Values are plain dicts; they can be sent to other processes.
+        for chunk in chunks:
+            for _, value in chunk:
+                if value is not None:
+                    self.assertIs(type(value), dict)
+                    self.assertTrue(all(type(block) is dict for block in value["blocks"]))
+
+    def test_bulk_render_in_process(self):
+        rendered = dict(bulk_render(
+            EditorJSTestModel.objects.all(), "content", cache=False, workers=0, chunk_size=2,
+        ))
+        self.assertEqual(rendered, self.expected)
+
+    def test_bulk_render_in_transaction(self):
+        # Tests run in a transaction; workers would need to close it's connection.
+        with self.assertRaises(ValueError):
+            next(bulk_render(EditorJSTestModel.objects.all(), "content", cache=False, workers=2))
+
+
+class TestBulkRenderWorkers(TransactionTestCase):
+    """
+        Workers cannot be started in a transaction; the data must be committed.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        features = ["header", "paragraph", "link"]
+        for i in range(7):
+            blocks = get_test_blocks(features[:i % len(features) + 1])
+            EditorJSTestModel.objects.create(
+                content={"blocks": blocks} if i % 3 else None,
+            )
+
+        self.expected = {
+            obj.pk: str(html)
+            for obj, html in render_editorjs_queryset(EditorJSTestModel.objects.all(), "content", cache=False)
+        }
+
+    @skipUnless(multiprocessing.get_start_method() == "fork", "workers only share the test database when forked")
+    def test_bulk_render_workers(self):
+        rendered = dict(bulk_render(
+            EditorJSTestModel.objects.all(), "content", cache=False, workers=2, chunk_size=2, max_pending=1,
+        ))
+        self.assertEqual(rendered, self.expected)
@@ -0,0 +1,136 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.utils import translation
+
+from .base import BaseEditorJSTest
+from wagtail_editorjs.cache import get_cache_key, get_block_cache_key
+from wagtail_editorjs.render import render_editorjs_html
+from wagtail_editorjs.registry import EDITOR_JS_FEATURES
+
+
+class BaseRenderCacheTest(BaseEditorJSTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.features = ["paragraph", "image", "attaches"]
+        self.data = {
+            "blocks": [
+                {
+                    "id": f"test_id_{feature}_{i}",
+                    "type": feature,
+                    "data": data,
+                }
+                for feature in self.features
+                for i, data in enumerate(EDITOR_JS_FEATURES[feature].get_test_data())
+            ],
+        }
+
+
+class TestRenderCache(BaseRenderCacheTest):
+
+    def test_render_cached(self):
+        html = render_editorjs_html(self.features, self.data, cache=True)
+
+        with self.assertNumQueries(0):
+            cached = render_editorjs_html(self.features, self.data, cache=True)
+
+        self.assertEqual(html, cached)
+
+    def test_render_not_cached(self):
+        render_editorjs_html(self.features, self.data, cache=False)
+
+        with self.assertNumQueries(2):
+            render_editorjs_html(self.features, self.data, cache=False)
+
+    def test_cache_key(self):
+        key = get_cache_key(self.features, self.data)
+        self.assertEqual(key, get_cache_key(list(self.features), {
+            "blocks": [dict(block) for block in self.data["blocks"]],
+        }))
+
+        changed = {
+            "blocks": self.data["blocks"] + [{
+                "id": "test_id_changed",
+                "type": "paragraph",
+                "data": {"text": "Changed"},
+            }],
+        }
+        self.assertNotEqual(key, get_cache_key(self.features, changed))
+        self.assertNotEqual(key, get_cache_key(self.features[:2], self.data))
+        self.assertNotEqual(key, get_cache_key(self.features, self.data, clean=False))
+        self.assertNotEqual(key, get_cache_key(self.features, self.data, whitelist_tags=["span"]))
+
+        with translation.override("nl"):
+            self.assertNotEqual(key, get_cache_key(self.features, self.data))
+
+    def test_cache_key_settings(self):
+        key = get_cache_key(self.features, self.data, clean=True)
+
+        with mock.patch("wagtail_editorjs.settings.SANITIZER", "wagtail_editorjs.sanitizer.SoupSanitizer"):
+            self.assertNotEqual(key, get_cache_key(self.features, self.data, clean=True))
+
+        with mock.patch("wagtail_editorjs.settings.HTML_PARSER", "lxml"):
+            self.assertNotEqual(key, get_cache_key(self.features, self.data, clean=True))
+
+        with mock.patch("wagtail_editorjs.render.is_wrapper_overridden", return_value=True):
+            self.assertNotEqual(key, get_cache_key(self.features, self.data, clean=True))
+
+        self.assertEqual(key, get_cache_key(self.features, self.data, clean=True))
+
+    def test_render_cache_settings(self):
+        html = render_editorjs_html(self.features, self.data, cache=True)
+
+        # A deploy which changes the output must not serve the HTML cached before it.
+        with mock.patch("wagtail_editorjs.render.is_wrapper_overridden", return_value=True), \
+                mock.patch("wagtail_editorjs.render.wrap_html", side_effect=lambda html, context=None: f"<section>{html}</section>"):
+            self.assertNotEqual(render_editorjs_html(self.features, self.data, cache=True), html)
+
+
+class TestBlockCache(BaseRenderCacheTest):
+
+    def test_render_block_cached(self):
+        html = render_editorjs_html(self.features, self.data, cache=False, block_cache=True)
+
+        with self.assertNumQueries(0):
+            cached = render_editorjs_html(self.features, self.data, cache=False, block_cache=True)
+
+        self.assertEqual(html, cached)
+        self.assertEqual(html, render_editorjs_html(self.features, self.data, cache=False, block_cache=False))
+
+    def test_render_changed_block(self):
+        render_editorjs_html(self.features, self.data, cache=False, block_cache=True)
+
+        blocks = [dict(block) for block in self.data["blocks"]]
+        blocks[0]["data"] = {"text": "Changed"}
+        changed = {"blocks": blocks}
+
+        # Only the changed paragraph is rendered again; the images and documents are not fetched.
+        with self.assertNumQueries(0):
+            html = render_editorjs_html(self.features, changed, cache=False, block_cache=True)
+
+        self.assertIn("Changed", html)
+        self.assertEqual(html, render_editorjs_html(self.features, changed, cache=False, block_cache=False))
+
+    def test_block_cache_key(self):
+        block = self.data["blocks"][0]
+        features = {
+            feature: EDITOR_JS_FEATURES[feature]
+            for feature in self.features
+        }
+        key = get_block_cache_key(features, block)
+        self.assertEqual(key, get_block_cache_key(features, dict(block)))
+        self.assertNotEqual(key, get_block_cache_key(features, block | {"data": {"text": "Changed"}}))
+        self.assertNotEqual(key, get_block_cache_key(features, block | {"tunes": {"text-alignment-tune": {"alignment": "center"}}}))
+
+        with translation.override("nl"):
+            self.assertNotEqual(key, get_block_cache_key(features, block))
+
+        # Pages might be on another site for another host; even without full URLs.
+        factory = RequestFactory()
+        with mock.patch("wagtail_editorjs.settings.USE_FULL_URLS", False), self.settings(ALLOWED_HOSTS=["example.com", "example.org"]):
+            self.assertNotEqual(
+                get_block_cache_key(features, block, {"request": factory.get("/", HTTP_HOST="example.com")}),
+                get_block_cache_key(features, block, {"request": factory.get("/", HTTP_HOST="example.org")}),
+            )
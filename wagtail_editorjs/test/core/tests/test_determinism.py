@@ -0,0 +1,67 @@
+from django.test import SimpleTestCase
+
+import os
+import subprocess
+import sys
+
+
+RENDER_CORPUS = """
+import django
+django.setup()
+
+from wagtail_editorjs.registry import EditorJSElement, wrapper
+from wagtail_editorjs.render import render_editorjs_html
+from wagtail_editorjs.test.core.tests.base import get_test_blocks
+
+features = [
+    "checklist", "code", "delimiter", "header", "nested-list", "paragraph",
+    "quote", "table", "warning", "underline", "marker", "inline-code",
+    "text-alignment-tune", "text-variant-tune", "background-color-tune", "text-color-tune",
+]
+tunes = {
+    "text-alignment-tune": {"alignment": "center"},
+    "background-color-tune": {"color": "#ff0000", "stretched": True},
+    "text-color-tune": {"color": "#00ff00"},
+}
+blocks = get_test_blocks(features[:12], tunes=tunes)
+for clean in [True, False]:
+    print(render_editorjs_html(features, {"blocks": blocks}, clean=clean, cache=False, block_cache=False))
+
+element = EditorJSElement("figure", "Figure", attrs={"class": ["with-border", "stretched", "with-background"]})
+element = wrapper(element, attrs={"class": {"tuned", "bg-stretched", "color-tuned"}, "data-test": "1"})
+element.add_attributes(class_=["tuned", "extra"])
+print(element)
+"""
+
+
+class TestDeterministicOutput(SimpleTestCase):
+    """
+        Renders the same documents in processes with different hash seeds;
+        the output must be byte-for-byte the same.
+    """
+
+    def render(self, seed: str) -> bytes:
+        env = dict(
+            os.environ,
+            PYTHONHASHSEED=seed,
+            PYTHONPATH=os.pathsep.join(sys.path),
+            DJANGO_SETTINGS_MODULE=os.environ.get(
+                "DJANGO_SETTINGS_MODULE", "wagtail_editorjs.test.testapp.settings",
+            ),
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", RENDER_CORPUS],
+            env=env,
+            capture_output=True,
+            timeout=300,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr.decode())
+        return result.stdout
+
+    def test_hash_seeds(self):
+        expected = self.render("0")
+        self.assertIn(b"wagtail-editorjs-richtext", expected)
+        self.assertIn(b'class="with-border stretched with-background"', expected)
+
+        for seed in ["1", "2", "12345"]:
+            self.assertEqual(self.render(seed), expected, f"Output differs with PYTHONHASHSEED={seed}")
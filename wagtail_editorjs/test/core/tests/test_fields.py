@@ -0,0 +1,158 @@
+from unittest import mock
+from django.db import models
+from django.test import RequestFactory
+from django.test.utils import isolate_apps
+
+from .base import BaseEditorJSTest, get_test_blocks
+from ..models import EditorJSRenderedTestModel, EditorJSRenderedFirstTestModel
+from wagtail_editorjs.cache import get_content_hash
+from wagtail_editorjs.fields import EditorJSField, split_rendered_html
+from wagtail_editorjs.render import render_editorjs_html
+
+
+class TestRenderedField(BaseEditorJSTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.features = ["header", "image", "link", "paragraph"]
+        self.obj = EditorJSRenderedTestModel.objects.create(
+            content={"blocks": get_test_blocks(["header", "image", "paragraph"])},
+        )
+
+    def test_rendered_on_save(self):
+        content_hash, html = split_rendered_html(self.obj.content_html)
+        self.assertEqual(content_hash, get_content_hash(self.features, self.obj.content))
+        self.assertHTMLEqual(html, render_editorjs_html(self.features, self.obj.content))
+
+        obj = EditorJSRenderedTestModel.objects.get(pk=self.obj.pk)
+        with self.assertNumQueries(0):
+            self.assertHTMLEqual(obj.get_content_html(), html)
+
+    def test_not_rendered_if_unchanged(self):
+        with mock.patch("wagtail_editorjs.fields.render_editorjs_html") as render:
+            self.obj.save()
+            EditorJSRenderedTestModel.objects.get(pk=self.obj.pk).save()
+
+        render.assert_not_called()
+
+    def test_rendered_if_changed(self):
+        self.obj.content["blocks"].append({
+            "id": "changed",
+            "type": "paragraph",
+            "data": {"text": "Changed"},
+        })
+        self.obj.save()
+
+        obj = EditorJSRenderedTestModel.objects.get(pk=self.obj.pk)
+        self.assertIn("Changed", obj.content_html)
+        self.assertEqual(split_rendered_html(obj.content_html)[0], get_content_hash(self.features, obj.content))
+
+    def test_stale(self):
+        content = {"blocks": get_test_blocks(["paragraph"])}
+        EditorJSRenderedTestModel.objects.filter(pk=self.obj.pk).update(content=content)
+
+        obj = EditorJSRenderedTestModel.objects.get(pk=self.obj.pk)
+        self.assertEqual(obj.content_html, self.obj.content_html)
+        self.assertHTMLEqual(
+            obj.get_content_html(),
+            render_editorjs_html(self.features, obj.content),
+        )
+
+    def test_update_fields(self):
+        self.obj.content["blocks"].append({
+            "id": "changed",
+            "type": "paragraph",
+            "data": {"text": "Changed"},
+        })
+        self.obj.save(update_fields=["content"])
+
+        obj = EditorJSRenderedTestModel.objects.get(pk=self.obj.pk)
+        self.assertIn("Changed", obj.content_html)
+        self.assertEqual(split_rendered_html(obj.content_html)[0], get_content_hash(self.features, obj.content))
+
+    def test_raw(self):
+        obj = EditorJSRenderedTestModel(
+            pk=self.obj.pk,
+            content={"blocks": get_test_blocks(["paragraph"])},
+            content_html="stored",
+        )
+        with mock.patch("wagtail_editorjs.fields.render_editorjs_html") as render:
+            obj.save_base(raw=True)
+
+        render.assert_not_called()
+        self.assertEqual(EditorJSRenderedTestModel.objects.get(pk=self.obj.pk).content_html, "stored")
+
+    def test_full_urls(self):
+        request = RequestFactory().get("/", HTTP_HOST="testserver")
+        with mock.patch("wagtail_editorjs.fields.render_editorjs_html") as render:
+            self.obj.get_content_html({"request": request})
+            render.assert_not_called()
+
+            with mock.patch("wagtail_editorjs.settings.USE_FULL_URLS", True):
+                self.obj.get_content_html()
+                render.assert_not_called()
+
+                # The stored HTML has no full URLs; it is rendered for the request instead.
+                self.obj.get_content_html({"request": request})
+                render.assert_called_once()
+
+    def test_null(self):
+        obj = EditorJSRenderedTestModel.objects.create(content=None)
+        self.assertEqual(obj.content_html, "")
+        self.assertEqual(obj.get_content_html(), "")
+
+    def test_split_rendered_html(self):
+        self.assertEqual(split_rendered_html("<!--editorjs:abc--><p>Test</p>"), ("abc", "<p>Test</p>"))
+        self.assertEqual(split_rendered_html("<p>Test</p>"), ("", "<p>Test</p>"))
+        self.assertEqual(split_rendered_html(None), ("", ""))
+
+    @isolate_apps("wagtail_editorjs.test.core")
+    def test_check(self):
+        class Model(models.Model):
+            missing = EditorJSField(rendered_field="missing_html")
+            wrong = EditorJSField(rendered_field="wrong_html")
+            wrong_html = models.IntegerField()
+
+        self.assertEqual(
+            [error.id for error in Model._meta.get_field("missing").check()],
+            ["wagtail_editorjs.E001"],
+        )
+        self.assertEqual(
+            [error.id for error in Model._meta.get_field("wrong").check()],
+            ["wagtail_editorjs.E002"],
+        )
+
+
+class TestRenderedFieldDeclaredFirst(BaseEditorJSTest):
+    """
+        The rendered field is declared before the `EditorJSField`; it must still be saved with the current HTML.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.features = ["header", "link", "paragraph"]
+
+    def assertRendered(self, obj):
+        obj = EditorJSRenderedFirstTestModel.objects.get(pk=obj.pk)
+        content_hash, html = split_rendered_html(obj.content_html)
+        self.assertEqual(content_hash, get_content_hash(self.features, obj.content))
+        self.assertHTMLEqual(html, render_editorjs_html(self.features, obj.content))
+
+    def test_insert(self):
+        obj = EditorJSRenderedFirstTestModel.objects.create(
+            content={"blocks": get_test_blocks(["header", "paragraph"])},
+        )
+        self.assertTrue(obj.content_html)
+        self.assertRendered(obj)
+
+    def test_update(self):
+        obj = EditorJSRenderedFirstTestModel.objects.create(
+            content={"blocks": get_test_blocks(["header"])},
+        )
+        obj.content = {"blocks": get_test_blocks(["paragraph"])}
+        obj.save()
+        self.assertRendered(obj)
+
+        obj.content = {"blocks": get_test_blocks(["header", "paragraph"])}
+        obj.save(update_fields=["content"])
+        self.assertRendered(obj)
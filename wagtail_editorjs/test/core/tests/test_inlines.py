@@ -1,9 +1,12 @@
+from unittest import mock
 from django.test import TestCase
 
 
 from .base import BaseEditorJSTest
+from wagtail_editorjs.render import render_editorjs_html
 from wagtail_editorjs.registry import (
     InlineEditorJSFeature,
+    InlineDispatcher,
     EDITOR_JS_FEATURES,
 )
 
@@ -76,3 +79,95 @@ class TestEditorJSInline(BaseEditorJSTest):
                     html,
                 )
 
+    def test_inlines_render(self):
+
+        for feature in self.inlines:
+            feature: InlineEditorJSFeature
+            test_data = feature.get_test_data()
+
+            if not test_data:
+                continue
+
+            blocks = [
+                {
+                    "id": "plain",
+                    "type": "paragraph",
+                    "data": {"text": "No inline markup here."},
+                },
+            ]
+            for i, (initial, _) in enumerate(test_data):
+                blocks.append({
+                    "id": f"inline_{i}",
+                    "type": "paragraph",
+                    "data": {"text": f"Inline {initial} markup"},
+                })
+
+            html = render_editorjs_html(
+                ["paragraph", feature.tool_name],
+                {"blocks": blocks},
+                clean=False,
+            )
+
+            self.assertInHTML("<p>No inline markup here.</p>", html)
+            for i, (_, output) in enumerate(test_data):
+                self.assertInHTML(
+                    f"<p>Inline {output} markup</p>",
+                    html,
+                )
+
+    def test_inlines_markers(self):
+
+        for feature in self.inlines:
+            feature: InlineEditorJSFeature
+            test_data = feature.get_test_data()
+
+            if not test_data:
+                continue
+
+            for initial, _ in test_data:
+                self.assertTrue(feature.has_markers(initial.lower()))
+
+            self.assertFalse(feature.has_markers(
+                f"<{feature.tag_name}>no markers</{feature.tag_name}>",
+            ))
+
+            blocks = [
+                {
+                    "id": "plain",
+                    "type": "paragraph",
+                    "data": {"text": f"<{feature.tag_name}>Plain</{feature.tag_name}> markup"},
+                },
+            ]
+
+            # No inline markers; the inline should never run.
+            with mock.patch.object(feature, "parse_inline_data") as parse_inline_data:
+                render_editorjs_html(
+                    ["paragraph", feature.tool_name],
+                    {"blocks": blocks},
+                    clean=False,
+                    cache=False,
+                )
+
+            parse_inline_data.assert_not_called()
+
+    def test_inline_dispatcher(self):
+        html = []
+        for feature in self.inlines:
+            for i, (initial, _) in enumerate(feature.get_test_data() or []):
+                html.append(f"<p data-testing-id='{feature.tool_name}_{i}'>{initial}</p>")
+
+        html = "\n".join(html)
+        expected = bs4.BeautifulSoup(html, "html.parser")
+        for feature in self.inlines:
+            feature.parse_inline_data(expected)
+
+        soup = bs4.BeautifulSoup(html, "html.parser")
+        dispatcher = InlineDispatcher(self.inlines)
+
+        # The soup is walked once for all features.
+        with mock.patch.object(InlineEditorJSFeature, "find_inline_data") as find_inline_data:
+            dispatcher.parse(soup)
+
+        find_inline_data.assert_not_called()
+        self.assertHTMLEqual(str(soup), str(expected))
+
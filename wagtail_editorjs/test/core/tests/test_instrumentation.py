@@ -0,0 +1,99 @@
+import copy
+from wagtail import hooks
+
+from .base import BaseEditorJSTest, get_test_blocks
+from wagtail_editorjs.hooks import RENDER_STATS_HOOK
+from wagtail_editorjs.instrumentation import (
+    RenderCollector,
+    is_recording,
+)
+from wagtail_editorjs.registry import EDITOR_JS_FEATURES
+from wagtail_editorjs.render import render_editorjs_html
+
+
+class TestInstrumentation(BaseEditorJSTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.features = ["paragraph", "image", "attaches", "link", "text-alignment-tune"]
+        self.data = {
+            "blocks": get_test_blocks(
+                ["paragraph", "image", "attaches", "link"],
+                tunes={"text-alignment-tune": {"alignment": "center"}},
+            ),
+        }
+
+    def test_collector(self):
+        self.assertFalse(is_recording())
+
+        with RenderCollector() as collector:
+            self.assertTrue(is_recording())
+            render_editorjs_html(self.features, self.data, clean=True, cache=False)
+
+        self.assertFalse(is_recording())
+
+        summary = collector.summary()
+        for key in [
+            ("feature", "paragraph"),
+            ("feature", "image"),
+            ("feature", "attaches"),
+            ("tune", "text-alignment-tune"),
+            ("inline", "link"),
+            ("sanitize", "BleachSanitizer"),
+            ("wrapper", "wagtail_editorjs/rich_text.html"),
+        ]:
+            self.assertIn(key, summary)
+            self.assertGreater(summary[key].size, 0)
+            self.assertGreaterEqual(summary[key].duration, 0)
+
+        # Every block is recorded separately.
+        self.assertEqual(
+            summary[("feature", "image")].count,
+            len([block for block in self.data["blocks"] if block["type"] == "image"]),
+        )
+
+        # All queries are made while prefetching and by the inlines.
+        self.assertEqual(summary[("prefetch", "image")].queries, 1)
+        self.assertEqual(summary[("prefetch", "attaches")].queries, 1)
+        self.assertEqual(summary[("inline", "link")].queries, 1)
+        self.assertEqual(summary[("feature", "image")].queries, 0)
+
+    def test_not_recording(self):
+        collector = RenderCollector()
+        render_editorjs_html(self.features, self.data, cache=False)
+        self.assertEqual(collector.records, [])
+
+    def test_hook(self):
+        calls = []
+
+        def hook(records, context):
+            calls.append((records, context))
+
+        context = {"block_id": "test"}
+        with hooks.register_temporarily(RENDER_STATS_HOOK, hook):
+            render_editorjs_html(self.features, self.data, context=context, cache=False)
+
+        self.assertEqual(len(calls), 1)
+        records, hook_context = calls[0]
+        self.assertIs(hook_context, context)
+        self.assertIn("image", {record.name for record in records if record.kind == "feature"})
+
+    def test_to_python_and_validate(self):
+        with RenderCollector() as collector:
+            EDITOR_JS_FEATURES.validate_for_tools(self.features, copy.deepcopy(self.data))
+            EDITOR_JS_FEATURES.to_python(self.features, copy.deepcopy(self.data))
+
+        summary = collector.summary()
+        for key in [
+            ("validate", "paragraph"),
+            ("validate", "image"),
+            ("validate", "text-alignment-tune"),
+            ("to_python", "paragraph"),
+            ("to_python", "image"),
+        ]:
+            self.assertIn(key, summary)
+
+        self.assertEqual(
+            summary[("to_python", "image")].count,
+            len([block for block in self.data["blocks"] if block["type"] == "image"]),
+        )
@@ -0,0 +1,95 @@
+from unittest import mock, skipUnless
+import importlib.util
+
+from .base import BaseEditorJSTest, get_test_blocks
+from wagtail_editorjs import settings
+from wagtail_editorjs.render import (
+    render_editorjs_html,
+    parse_inline_fragments,
+)
+from wagtail_editorjs.registry import (
+    EditorJSFeature,
+    EditorJSSoupElement,
+    InlineEditorJSFeature,
+    EDITOR_JS_FEATURES,
+)
+
+
+HAS_LXML = importlib.util.find_spec("lxml") is not None
+
+
+@skipUnless(HAS_LXML, "lxml is not installed")
+class TestHTMLParsers(BaseEditorJSTest):
+    """
+        Output must be the same regardless of the configured `EDITORJS_HTML_PARSER`.
+    """
+
+    parsers = ["html.parser", "lxml"]
+
+    def render_with_parsers(self, func, *args, **kwargs) -> dict[str, str]:
+        rendered = {}
+        for parser in self.parsers:
+            with mock.patch.object(settings, "HTML_PARSER", parser):
+                rendered[parser] = func(*args, **kwargs)
+        return rendered
+
+    def assertParsersEqual(self, rendered: dict[str, str]):
+        expected = rendered[self.parsers[0]]
+        for parser, html in rendered.items():
+            self.assertEqual(html, expected, f"Output of {parser} differs from {self.parsers[0]}")
+
+    def test_render_features(self):
+        for feature in EDITOR_JS_FEATURES.keys():
+            if not isinstance(EDITOR_JS_FEATURES[feature], EditorJSFeature):
+                continue
+
+            blocks = get_test_blocks([feature])
+            if not blocks:
+                continue
+
+            rendered = self.render_with_parsers(
+                render_editorjs_html, [feature], {"blocks": blocks}, cache=False, block_cache=False,
+            )
+            self.assertParsersEqual(rendered)
+
+    def test_render_all_features(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        rendered = self.render_with_parsers(
+            render_editorjs_html,
+            features,
+            {"blocks": get_test_blocks(tunes={"text-alignment-tune": {"alignment": "center"}})},
+            cache=False,
+            block_cache=False,
+        )
+        self.assertParsersEqual(rendered)
+
+    def test_inlines(self):
+        for feature in EDITOR_JS_FEATURES.features.values():
+            if not isinstance(feature, InlineEditorJSFeature):
+                continue
+
+            test_data = feature.get_test_data()
+            if not test_data:
+                continue
+
+            fragments = [
+                f"<p>Inline {initial} data</p>"
+                for initial, _ in test_data
+            ]
+            rendered = self.render_with_parsers(
+                parse_inline_fragments, fragments, [feature],
+            )
+            self.assertParsersEqual(rendered)
+            self.assertHTMLEqual(
+                "".join(rendered["lxml"]),
+                "".join(f"<p>Inline {output} data</p>" for _, output in test_data),
+            )
+
+    def test_soup_element_attributes(self):
+        def build():
+            element = EditorJSSoupElement("<div class=\"block\"><p>Hello, <b>world</b>!</p><img src=\"image.png\"></div>")
+            element.add_attributes(class_="tuned", style={"text-align": "center"})
+            element.attrs["data-editorjs-block-id"] = "test_id"
+            return str(element)
+
+        self.assertParsersEqual(self.render_with_parsers(build))
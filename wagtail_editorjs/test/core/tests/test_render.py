@@ -1,10 +1,27 @@
 from typing import Any
+from django.conf import settings
+from django.template import Context
 from django.template.loader import render_to_string
+from django.test import override_settings
 from django.utils.safestring import mark_safe
+from asgiref.sync import async_to_sync
 from bs4 import BeautifulSoup
 
-from .base import BaseEditorJSTest
-from wagtail_editorjs.render import render_editorjs_html
+from .base import BaseEditorJSTest, get_test_blocks
+from ..models import EditorJSTestModel
+from wagtail_editorjs.instrumentation import RenderCollector
+from wagtail_editorjs.render import (
+    render_editorjs_html,
+    render_editorjs_many,
+    render_editorjs_queryset,
+    iter_editorjs_html,
+    render_editorjs_incremental,
+    RenderedDocument,
+    arender_editorjs_html,
+    arender_editorjs_many,
+    is_wrapper_overridden,
+    wrap_html,
+)
 from wagtail_editorjs.registry import (
     EditorJSTune,
     EditorJSFeature,
@@ -12,6 +29,9 @@ from wagtail_editorjs.registry import (
     EDITOR_JS_FEATURES,
 )
 
+import os
+import tempfile
+
 
 class TestEditorJSTune(EditorJSTune):
     allowed_attributes = {
@@ -163,3 +183,224 @@ class TestEditorJSFeatures(BaseEditorJSTest):
             )
 
 
+
+    def test_prefetch_editorjs_features(self):
+        features = ["image", "images", "attaches"]
+        blocks = get_test_blocks(features) * 10
+
+        html = render_editorjs_html(features, {"blocks": blocks}, clean=False)
+
+        # One query per feature; regardless of the amount of blocks.
+        with self.assertNumQueries(3):
+            prefetched = render_editorjs_html(features, {"blocks": blocks}, clean=False)
+
+        self.assertEqual(html, prefetched)
+
+        expected = render_to_string(
+            "wagtail_editorjs/rich_text.html",
+            {"html": mark_safe("\n".join([
+                str(EDITOR_JS_FEATURES[block["type"]].render_block_data(block))
+                for block in blocks
+            ]))}
+        )
+        self.assertHTMLEqual(
+            BeautifulSoup(html, "html.parser").decode(False),
+            BeautifulSoup(expected, "html.parser").decode(False),
+        )
+
+    def test_render_editorjs_many(self):
+        features = ["image", "attaches", "paragraph"]
+        values = [
+            {"blocks": get_test_blocks(features)},
+            {"blocks": get_test_blocks(["attaches"])},
+            {"blocks": []},
+            {"blocks": get_test_blocks(["image"])},
+        ]
+
+        expected = [
+            render_editorjs_html(features, value)
+            for value in values
+        ]
+
+        # One query per feature for all values.
+        with self.assertNumQueries(2):
+            rendered = render_editorjs_many(values, features)
+
+        self.assertEqual(rendered, expected)
+
+    def test_render_editorjs_queryset(self):
+        features = EditorJSTestModel._meta.get_field("content").features
+        for blocks in [get_test_blocks(["image", "attaches"]), get_test_blocks(["header"]), None]:
+            EditorJSTestModel.objects.create(
+                content={"blocks": blocks} if blocks else None,
+            )
+
+        queryset = EditorJSTestModel.objects.order_by("pk")
+        expected = [
+            render_editorjs_html(features, obj.content) if obj.content else ""
+            for obj in queryset
+        ]
+
+        # One query for the objects and one per feature.
+        with self.assertNumQueries(3):
+            rendered = render_editorjs_queryset(queryset.all(), "content")
+
+        self.assertEqual([obj.pk for obj, _ in rendered], [obj.pk for obj in queryset])
+        self.assertEqual([html for _, html in rendered], expected)
+
+    def test_iter_editorjs_html(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        blocks = get_test_blocks()
+        expected = render_editorjs_html(features, {"blocks": blocks}, clean=True, cache=False)
+
+        for batch_size in [1, 3, len(blocks) + 1]:
+            chunks = list(iter_editorjs_html(
+                features, {"blocks": blocks}, clean=True, batch_size=batch_size,
+            ))
+            # Opening wrapper, one chunk per block and the closing wrapper.
+            self.assertEqual(len(chunks), len(blocks) + 2)
+            self.assertEqual("".join(chunks), expected)
+
+        self.assertEqual(
+            "".join(iter_editorjs_html(features, {"blocks": []})),
+            render_editorjs_html(features, {"blocks": []}, cache=False),
+        )
+
+    def test_arender_editorjs_html(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        blocks = get_test_blocks()
+        expected = render_editorjs_html(features, {"blocks": blocks}, cache=False)
+
+        self.assertEqual(
+            async_to_sync(arender_editorjs_html)(features, {"blocks": blocks}, cache=False),
+            expected,
+        )
+
+    def test_arender_editorjs_many(self):
+        features = ["image", "attaches", "paragraph"]
+        values = [
+            {"blocks": get_test_blocks(features)},
+            {"blocks": get_test_blocks(["attaches"])},
+            {"blocks": []},
+        ]
+        expected = render_editorjs_many(values, features, cache=False)
+
+        # One query per feature for all values.
+        with self.assertNumQueries(2):
+            rendered = async_to_sync(arender_editorjs_many)(values, features, cache=False)
+
+        self.assertEqual(rendered, expected)
+
+    def test_wrap_html(self):
+        self.assertFalse(is_wrapper_overridden())
+
+        html = mark_safe("<p>Hello, <b>world</b>!</p>")
+        for context in [None, {}, {"block_id": "block-1"}, {"block_id": "<script>"}, Context({"block_id": 5})]:
+            expected = render_to_string(
+                "wagtail_editorjs/rich_text.html",
+                {"html": html, **(context.flatten() if isinstance(context, Context) else context or {})},
+            )
+            self.assertEqual(wrap_html(html, context), expected)
+
+    def test_wrap_html_overridden(self):
+        with tempfile.TemporaryDirectory() as directory:
+            template = os.path.join(directory, "wagtail_editorjs", "rich_text.html")
+            os.makedirs(os.path.dirname(template))
+            with open(template, "w") as f:
+                f.write("<section>{{ html|safe }}</section>")
+
+            templates = [settings.TEMPLATES[0] | {"DIRS": [directory]}]
+            with override_settings(TEMPLATES=templates):
+                self.assertTrue(is_wrapper_overridden())
+                self.assertEqual(
+                    wrap_html(mark_safe("<p>Hello</p>")),
+                    "<section><p>Hello</p></section>",
+                )
+
+        self.assertFalse(is_wrapper_overridden())
+
+    def test_render_editorjs_incremental(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        blocks = get_test_blocks()
+
+        for clean in [True, False]:
+            previous = render_editorjs_incremental(features, {"blocks": blocks}, clean=clean)
+            self.assertIsInstance(previous, RenderedDocument)
+            self.assertEqual(
+                str(previous),
+                render_editorjs_html(features, {"blocks": blocks}, clean=clean, cache=False),
+            )
+
+            changed = [dict(block) for block in blocks]
+            changed[0] = {
+                "id": changed[0]["id"],
+                "type": "paragraph",
+                "data": {"text": "Changed <a href=\"https://example.com\">link</a>"},
+            }
+            changed.insert(2, {
+                "id": "added",
+                "type": "header",
+                "data": {"text": "Added", "level": 2},
+            })
+            del changed[5]
+            changed[6], changed[7] = changed[7], changed[6]
+
+            with RenderCollector() as collector:
+                document = render_editorjs_incremental(
+                    features, {"blocks": changed}, RenderedDocument.deserialize(previous.serialize()), clean=clean,
+                )
+
+            # Only the changed and added blocks are rendered.
+            rendered = [record for record in collector.records if record.kind == "feature"]
+            self.assertEqual([record.name for record in rendered], ["paragraph", "header"])
+
+            self.assertEqual(
+                str(document),
+                render_editorjs_html(features, {"blocks": changed}, clean=clean, cache=False),
+            )
+
+    def test_render_malformed_blocks(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        blocks = [
+            {"id": "unclosed", "type": "raw", "data": {"html": "<b>unclosed"}},
+            {"id": "paragraph", "type": "paragraph", "data": {"text": "hello"}},
+            {"id": "stray", "type": "raw", "data": {"html": "</div><p>x</p>"}},
+        ]
+
+        for clean in [True, False]:
+            with self.subTest(clean=clean):
+                expected = render_editorjs_html(features, {"blocks": blocks}, clean=clean, cache=False)
+                if clean:
+                    # Unclosed tags are closed within their own block.
+                    self.assertIn('<b>unclosed</b></div>\n<p>hello</p>', expected)
+
+                self.assertEqual(
+                    str(render_editorjs_incremental(features, {"blocks": blocks}, clean=clean)),
+                    expected,
+                )
+                self.assertEqual(
+                    "".join(iter_editorjs_html(features, {"blocks": blocks}, clean=clean)),
+                    expected,
+                )
+                self.assertEqual(
+                    async_to_sync(arender_editorjs_html)(features, {"blocks": blocks}, clean=clean, cache=False),
+                    expected,
+                )
+
+    def test_render_editorjs_incremental_options(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        blocks = get_test_blocks()
+        previous = render_editorjs_incremental(features, {"blocks": blocks}, clean=True)
+
+        # Rendered with different options; nothing can be re-used.
+        with RenderCollector() as collector:
+            document = render_editorjs_incremental(features, {"blocks": blocks}, previous, clean=False)
+
+        self.assertEqual(
+            len([record for record in collector.records if record.kind == "feature"]),
+            len(blocks),
+        )
+        self.assertEqual(
+            str(document),
+            render_editorjs_html(features, {"blocks": blocks}, clean=False, cache=False),
+        )
@@ -0,0 +1,130 @@
+from django.test import TestCase
+import bleach
+
+from .base import BaseEditorJSTest, get_test_blocks
+from wagtail_editorjs.render import render_editorjs_html
+from wagtail_editorjs.sanitizer import (
+    NullSanitizer,
+    BleachSanitizer,
+    SoupSanitizer,
+    StreamSanitizer,
+    get_policy,
+)
+from wagtail_editorjs.registry import EDITOR_JS_FEATURES
+
+
+TESTING_HTML = """
+<div class="warning" data-editorjs-block-id="1">
+    <h2 onclick="alert(1)">Warning</h2>
+    <p style="color: red">This is a warning message.</p>
+</div>
+<script>alert("Hello, World!")</script>
+<span class="wagtail-tooltip" data-tippy-content="Tooltip">Tooltip</span>
+"""
+
+
+class TestSanitizerPolicy(TestCase):
+
+    def test_policy_memoized(self):
+        features = ["paragraph", "warning"]
+        policy = get_policy(features)
+
+        self.assertIs(policy, get_policy(list(features)))
+        self.assertIs(policy.sanitizer, policy.sanitizer)
+        self.assertIs(policy.sanitizer.cleaner, policy.sanitizer.cleaner)
+        self.assertIsNot(policy, get_policy(features, whitelist_tags=["span"]))
+        self.assertIsNot(policy, get_policy(features, whitelist_attrs=["style"]))
+        self.assertIsNot(policy, get_policy(["paragraph"]))
+
+    def test_policy_clean(self):
+        features = ["paragraph", "warning", "tooltip"]
+        policy = get_policy(features, whitelist_attrs={"p": ["style"]})
+
+        allowed_attributes = {}
+        for feature in features:
+            for key, value in EDITOR_JS_FEATURES[feature].allowed_attributes.items():
+                allowed_attributes.setdefault(key, set()).update(value)
+
+        allowed_attributes.setdefault("*", set()).add("data-editorjs-block-id")
+        allowed_attributes.setdefault("p", set()).add("style")
+
+        self.assertEqual(
+            policy.clean(TESTING_HTML),
+            bleach.clean(
+                TESTING_HTML,
+                tags=policy.tags,
+                attributes=allowed_attributes,
+                css_sanitizer=NullSanitizer,
+            ),
+        )
+        self.assertIn("&lt;script&gt;", policy.clean(TESTING_HTML))
+        self.assertNotIn("onclick", policy.clean(TESTING_HTML))
+
+
+class TestSanitizerBackends(BaseEditorJSTest):
+
+    def test_soup_sanitizer(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        policy = get_policy(features)
+        html = render_editorjs_html(
+            features,
+            {"blocks": get_test_blocks(features)},
+            clean=False,
+        ) + TESTING_HTML
+
+        self.assertHTMLEqual(
+            SoupSanitizer(policy).clean(html),
+            BleachSanitizer(policy).clean(html),
+        )
+
+    def test_soup_sanitizer_escapes(self):
+        policy = get_policy(["paragraph", "link"])
+        sanitizer = SoupSanitizer(policy)
+
+        self.assertEqual(
+            sanitizer.clean("<script>alert(1) < 2</script><!-- comment --><p onclick='x()'>Text</p>"),
+            "&lt;script&gt;alert(1) &lt; 2&lt;/script&gt;<p>Text</p>",
+        )
+        self.assertEqual(
+            sanitizer.clean('<a href="javascript:alert(1)" class="page-link">Link</a>'),
+            '<a class="page-link">Link</a>',
+        )
+
+    def test_stream_sanitizer(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        policy = get_policy(features)
+        html = render_editorjs_html(
+            features,
+            {"blocks": get_test_blocks(features)},
+            clean=False,
+        ) + TESTING_HTML
+
+        sanitizer = StreamSanitizer(policy)
+        expected = sanitizer.clean(html)
+        self.assertHTMLEqual(expected, BleachSanitizer(policy).clean(html))
+
+        # Chunks can be split anywhere; even inside of tags and entities.
+        for size in [1, 7, 100]:
+            chunks = [html[i:i + size] for i in range(0, len(html), size)]
+            self.assertEqual("".join(sanitizer.clean_iter(chunks)), expected)
+
+    def test_stream_sanitizer_escapes(self):
+        policy = get_policy(["paragraph", "link"])
+        sanitizer = StreamSanitizer(policy)
+
+        self.assertEqual(
+            sanitizer.clean("<script>alert(1) < 2</script><!-- comment --><p onclick='x()'>Text</p>"),
+            "&lt;script&gt;alert(1) &lt; 2&lt;/script&gt;<p>Text</p>",
+        )
+        self.assertEqual(
+            sanitizer.clean('<a href="javascript:alert(1)" class="page-link">Link</a>'),
+            '<a class="page-link">Link</a>',
+        )
+        self.assertEqual(
+            StreamSanitizer(get_policy(["paragraph", "delimiter"])).clean('<hr/><p>Unclosed <b>bold</p></i>'),
+            '<hr><p>Unclosed <b>bold</b></p>',
+        )
+        self.assertEqual(
+            sanitizer.clean('<p>Unclosed <b>bold</p></i><br/>&amp; &nbsp;'),
+            '<p>Unclosed <b>bold</b></p>&lt;br&gt;&amp; &nbsp;',
+        )
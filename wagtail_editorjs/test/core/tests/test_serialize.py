@@ -0,0 +1,110 @@
+from django.test import SimpleTestCase
+
+from .base import BaseEditorJSTest, get_test_blocks
+from wagtail_editorjs.render import render_block
+from wagtail_editorjs.registry import (
+    EDITOR_JS_FEATURES,
+    EditorJSElement,
+    EditorJSSoupElement,
+    EditorJSStyleAttribute,
+    EditorJSWrapper,
+    dump_element,
+    load_element,
+)
+from wagtail_editorjs.registry.element.serialize import SERIALIZATION_HEADER
+
+
+class StatefulElement(EditorJSElement):
+    """
+        An element which holds state besides it's tag, attributes and content.
+    """
+    def __init__(self, tag: str, content = None, attrs = None):
+        super().__init__(tag, content, attrs)
+        self.extra = "state"
+
+
+class TestSerializeFeatures(BaseEditorJSTest):
+
+    def test_features(self):
+        features = list(EDITOR_JS_FEATURES.keys())
+        feature_mappings = {
+            feature: EDITOR_JS_FEATURES[feature]
+            for feature in features
+        }
+
+        blocks = get_test_blocks(features, tunes={"text-alignment-tune": {"alignment": "center"}})
+        self.assertTrue(blocks)
+
+        for block in blocks:
+            element = render_block(feature_mappings, block)
+            if element is None:
+                continue
+
+            with self.subTest(feature=block["type"]):
+                loaded = load_element(dump_element(element))
+                self.assertIs(type(loaded), type(element))
+                self.assertEqual(str(loaded), str(element))
+
+
+class TestSerialize(SimpleTestCase):
+
+    def test_round_trip(self):
+        element = EditorJSWrapper(
+            EditorJSElement("p", [
+                "Hello, ",
+                EditorJSElement("b", "world", attrs={"class": ["b", "a", "b"]}),
+                EditorJSElement("i", "!"),
+                1,
+            ], attrs={"style": {"text-align": "center"}}),
+            attrs={"class": "wrapper", "data-id": "test_id"},
+        )
+
+        loaded = load_element(dump_element(element))
+        self.assertEqual(str(loaded), str(element))
+        self.assertIsInstance(loaded, EditorJSWrapper)
+        self.assertIsInstance(loaded.wrapped_element.attrs["style"], EditorJSStyleAttribute)
+
+        # The loaded tree can still be changed; as tunes and inlines would.
+        loaded.add_attributes(class_="tuned")
+        loaded.wrapped_element.attrs["style"].extend({"color": "red"})
+        self.assertEqual(
+            str(loaded),
+            '<div class="wrapper tuned" data-id="test_id">'
+            '<p style="text-align: center;color: red">Hello, \n<b class="b a">world</b>\n<i>!</i>\n1</p>'
+            '</div>',
+        )
+
+    def test_nested(self):
+        element = EditorJSElement("div")
+        for _ in range(5000):
+            element = EditorJSElement("div", [element])
+
+        self.assertEqual(str(load_element(dump_element(element))), str(element))
+
+    def test_unserializable(self):
+        element = EditorJSElement("div", [
+            StatefulElement("p", "Stateful"),
+            EditorJSSoupElement("<p class=\"soup\">Soup</p>"),
+        ])
+
+        loaded = load_element(dump_element(element))
+        self.assertEqual(str(loaded), str(element))
+        self.assertEqual(loaded._content, [
+            "<p>Stateful</p>",
+            "<p class=\"soup\">Soup</p>",
+        ])
+
+        with self.assertRaises(TypeError):
+            dump_element(StatefulElement("p", "Stateful"))
+
+    def test_invalid(self):
+        data = dump_element(EditorJSElement("p", "Test"))
+
+        with self.assertRaises(ValueError):
+            load_element(SERIALIZATION_HEADER + bytes([0]) + data[len(SERIALIZATION_HEADER) + 1:])
+
+        with self.assertRaises(ValueError):
+            load_element(data[:-4])
+
+        with self.assertRaises(ValueError):
+            load_element(data.replace(b"EditorJSElement", b"EditorJSMissing"))
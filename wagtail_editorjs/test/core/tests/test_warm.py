@@ -0,0 +1,113 @@
+from io import StringIO
+from unittest import mock
+from django.core.cache import cache
+from django.core.management import call_command, CommandError
+from django.test import RequestFactory, override_settings
+
+from .base import BaseEditorJSTest, get_test_blocks
+from ..models import EditorJSTestModel, EditorJSStreamTestModel
+from wagtail_editorjs.cache import get_cache_key
+from wagtail_editorjs.management.commands.editorjs_warm import (
+    get_editorjs_fields,
+    iter_block_values,
+)
+
+import json
+import os
+import tempfile
+
+
+class TestWarmCommand(BaseEditorJSTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        patcher = mock.patch("wagtail_editorjs.settings.RENDER_CACHE", "default")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache.clear()
+        for features in [["paragraph", "header"], ["image", "link"], ["attaches"]]:
+            EditorJSTestModel.objects.create(content={"blocks": get_test_blocks(features)})
+        EditorJSTestModel.objects.create(content=None)
+
+        EditorJSStreamTestModel.objects.create(body=[
+            ("editorjs", {"blocks": get_test_blocks(["header", "image"])}),
+            ("section", {"title": "Section", "content": {"blocks": get_test_blocks(["paragraph"])}}),
+            ("columns", [
+                {"blocks": get_test_blocks(["paragraph", "link"])},
+                {"blocks": get_test_blocks(["link"])},
+            ]),
+            ("text", "Not EditorJS"),
+        ])
+
+    def call_command(self, *args) -> str:
+        stdout = StringIO()
+        call_command("editorjs_warm", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def get_values(self) -> list[tuple[list[str], dict]]:
+        values = []
+        field = EditorJSTestModel._meta.get_field("content")
+        for obj in EditorJSTestModel.objects.filter(content__isnull=False):
+            values.append((field.features, obj.content))
+
+        field = EditorJSStreamTestModel._meta.get_field("body")
+        for obj in EditorJSStreamTestModel.objects.all():
+            values.extend(iter_block_values(field.stream_block, obj.body))
+
+        return values
+
+    def test_fields(self):
+        fields = {
+            f"{model._meta.label}.{field.name}"
+            for model, field in get_editorjs_fields()
+        }
+        self.assertIn("core.EditorJSTestModel.content", fields)
+        self.assertIn("core.EditorJSStreamTestModel.body", fields)
+
+    def test_warm(self):
+        values = self.get_values()
+        self.assertEqual(len(values), 7)
+
+        for features, data in values:
+            self.assertIsNone(cache.get(get_cache_key(features, data)))
+
+        output = self.call_command()
+        self.assertIn("core.EditorJSTestModel.content: warmed 4 rows", output)
+        self.assertIn("core.EditorJSStreamTestModel.body: warmed 1 rows", output)
+
+        for features, data in values:
+            self.assertIsNotNone(cache.get(get_cache_key(features, data)))
+
+    def test_warm_without_render_cache(self):
+        with mock.patch("wagtail_editorjs.settings.RENDER_CACHE", None):
+            with self.assertRaises(CommandError):
+                self.call_command()
+
+        for features, data in self.get_values():
+            self.assertIsNone(cache.get(get_cache_key(features, data)))
+
+    @override_settings(ALLOWED_HOSTS=["example.com"])
+    def test_warm_url(self):
+        self.call_command("core.EditorJSTestModel", "--url", "https://example.com")
+
+        request = RequestFactory().get("/", HTTP_HOST="example.com", secure=True)
+        for features, data in self.get_values()[:3]:
+            self.assertIsNotNone(cache.get(get_cache_key(features, data, {"request": request})))
+            self.assertIsNone(cache.get(get_cache_key(features, data)))
+
+    def test_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            self.call_command("core.EditorJSTestModel", "--checkpoint", path, "--chunk-size", "3")
+
+            with open(path) as f:
+                self.assertEqual(json.load(f), {
+                    "core.EditorJSTestModel.content": EditorJSTestModel.objects.latest("pk").pk,
+                })
+
+            EditorJSTestModel.objects.create(content={"blocks": get_test_blocks(["paragraph"])})
+            output = self.call_command("core.EditorJSTestModel", "--checkpoint", path)
+            self.assertIn("warmed 1 rows", output)
+
+            output = self.call_command("core.EditorJSTestModel", "--checkpoint", path, "--reset")
+            self.assertIn("warmed 5 rows", output)